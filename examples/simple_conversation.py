@@ -12,7 +12,9 @@ import sys
 # Ajouter le répertoire src au PYTHONPATH pour les imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from regulai.agent import create_agent, run_agent_conversation, stream_agent_conversation
+import asyncio
+
+from regulai.agent import create_agent, arun_agent_conversations, stream_agent_conversation
 from regulai.config import get_config
 
 
@@ -46,18 +48,15 @@ def exemple_conversation_simple():
             "Peux-tu rechercher des informations sur les congés payés ?",
         ]
         
-        for i, message in enumerate(messages_test, 1):
+        # Traiter toutes les questions en parallèle (latences LLM/MCP recouvertes)
+        responses = asyncio.run(
+            arun_agent_conversations(messages_test, thread_prefix="exemple", agent=agent)
+        )
+
+        for i, (message, response) in enumerate(zip(messages_test, responses), 1):
             print(f"\n" + "─" * 60)
             print(f"💬 Exemple {i}: {message}")
             print("─" * 60)
-            
-            # Utiliser l'agent pour répondre
-            response = run_agent_conversation(
-                message, 
-                thread_id=f"exemple-{i}",
-                agent=agent
-            )
-            
             print(f"🤖 Réponse: {response}")
         
         print(f"\n" + "=" * 60)
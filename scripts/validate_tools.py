@@ -5,9 +5,12 @@ Ce script vérifie que tous les outils sont correctement configurés
 et peuvent être utilisés par l'agent LangGraph.
 """
 
+import functools
 import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 # Ajouter le répertoire src au PYTHONPATH pour les imports
@@ -17,6 +20,32 @@ from regulai.tools import get_available_tools, test_mcp_connection, get_mcp_serv
 from regulai.config import get_config
 
 
+# Motif précompilé de détection d'erreur dans les réponses : un seul scan
+# insensible à la casse au niveau C, sans copie .lower() de la réponse
+_ERROR_PATTERN = re.compile(r"erreur|error|connexion|timeout", re.IGNORECASE)
+
+# Les messages d'erreur apparaissent en tête de réponse : inutile de scanner
+# au-delà de ce préfixe pour les très grosses réponses
+_ERROR_SCAN_LIMIT = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_for(args_schema) -> Dict[str, Any]:
+    """
+    Extrait le schéma JSON d'un modèle d'arguments Pydantic, mémorisé par classe.
+
+    La génération du schéma parcourt tout l'arbre du modèle : la validation et
+    le rapport partagent ainsi un seul parcours par outil.
+
+    Args:
+        args_schema: Classe Pydantic du schéma d'arguments
+
+    Returns:
+        Schéma JSON du modèle
+    """
+    return args_schema.model_json_schema()
+
+
 def validate_tool_structure(tool) -> Dict[str, Any]:
     """
     Valide la structure d'un outil LangChain.
@@ -38,7 +67,7 @@ def validate_tool_structure(tool) -> Dict[str, Any]:
     # Vérifier le schéma d'arguments
     if validation["has_args_schema"]:
         try:
-            schema = tool.args_schema.schema()
+            schema = _schema_for(tool.args_schema)
             validation["schema_fields"] = list(schema.get("properties", {}).keys())
             validation["schema_valid"] = True
         except Exception as e:
@@ -82,13 +111,15 @@ def test_tool_invocation(tool, test_args: Dict[str, Any]) -> Dict[str, Any]:
     
     try:
         response = tool.invoke(test_args)
+        # Matérialiser la représentation texte une seule fois : elle sert à
+        # la longueur, à la détection d'erreur et à l'aperçu du rapport
+        rendered = response if isinstance(response, str) else str(response)
         test_result["success"] = True
-        test_result["response"] = response
-        test_result["response_length"] = len(str(response))
-        
+        test_result["response"] = rendered
+        test_result["response_length"] = len(rendered)
+
         # Vérifier que la réponse n'est pas une erreur
-        response_str = str(response).lower()
-        if any(error_keyword in response_str for error_keyword in ["erreur", "error", "connexion", "timeout"]):
+        if _ERROR_PATTERN.search(rendered[:_ERROR_SCAN_LIMIT]):
             test_result["warning"] = "La réponse semble contenir une erreur"
             
     except Exception as e:
@@ -97,16 +128,22 @@ def test_tool_invocation(tool, test_args: Dict[str, Any]) -> Dict[str, Any]:
     return test_result
 
 
-def validate_all_tools():
-    """Valide tous les outils disponibles."""
+def validate_all_tools(mcp_available: bool | None = None):
+    """
+    Valide tous les outils disponibles.
+
+    Args:
+        mcp_available: Résultat d'une sonde MCP déjà effectuée (sondé ici si None)
+    """
     print("🔍 Validation des outils LangGraph Légifrance")
     print("=" * 60)
-    
+
     # 1. Tester la connexion MCP
     print("\n📡 Test de connexion MCP")
     print("-" * 30)
-    
-    mcp_available = test_mcp_connection()
+
+    if mcp_available is None:
+        mcp_available = test_mcp_connection()
     if mcp_available:
         print("✅ Serveur MCP accessible")
         server_info = get_mcp_server_info()
@@ -148,27 +185,32 @@ def validate_all_tools():
         "browse_code": {"code_name": "Code du travail", "section": "L3141"}
     }
     
+    # Invoquer les outils en parallèle : les round-trips MCP indépendants
+    # se recouvrent (~1×RTT au lieu de la somme des latences)
+    tools_to_test = [tool for tool in tools if tool.name in test_cases]
     invocation_results = []
-    for tool in tools:
-        if tool.name in test_cases:
-            test_args = test_cases[tool.name]
-            result = test_tool_invocation(tool, test_args)
-            invocation_results.append(result)
-            
-            # Afficher les résultats
-            print(f"\n🧪 Test {tool.name}")
-            print(f"   Arguments: {test_args}")
-            print(f"   Succès: {'✅' if result['success'] else '❌'}")
-            print(f"   Longueur réponse: {result['response_length']} chars")
-            
-            if result['error']:
-                print(f"   ❌ Erreur: {result['error']}")
-            elif result.get('warning'):
-                print(f"   ⚠️  {result['warning']}")
-            elif result['success']:
-                # Afficher un aperçu de la réponse
-                response_preview = str(result['response'])[:100]
-                print(f"   📄 Aperçu: {response_preview}...")
+    if tools_to_test:
+        with ThreadPoolExecutor(max_workers=len(tools_to_test)) as executor:
+            invocation_results = list(executor.map(
+                lambda tool: test_tool_invocation(tool, test_cases[tool.name]),
+                tools_to_test
+            ))
+
+    # Afficher les résultats dans l'ordre des outils
+    for result in invocation_results:
+        print(f"\n🧪 Test {result['tool_name']}")
+        print(f"   Arguments: {result['test_args']}")
+        print(f"   Succès: {'✅' if result['success'] else '❌'}")
+        print(f"   Longueur réponse: {result['response_length']} chars")
+
+        if result['error']:
+            print(f"   ❌ Erreur: {result['error']}")
+        elif result.get('warning'):
+            print(f"   ⚠️  {result['warning']}")
+        elif result['success']:
+            # Afficher un aperçu de la réponse (déjà matérialisée en str)
+            response_preview = result['response'][:100]
+            print(f"   📄 Aperçu: {response_preview}...")
     
     # 4. Résumé des résultats
     print("\n📊 Résumé de la validation")
@@ -195,16 +237,21 @@ def validate_all_tools():
         return False
 
 
-def generate_tools_report():
-    """Génère un rapport détaillé des outils."""
+def generate_tools_report(mcp_available: bool | None = None):
+    """
+    Génère un rapport détaillé des outils.
+
+    Args:
+        mcp_available: Résultat d'une sonde MCP déjà effectuée (sondé ici si None)
+    """
     print("\n📋 Génération du rapport des outils")
     print("-" * 40)
-    
+
     tools = get_available_tools()
-    
+
     report = {
         "timestamp": str(type(None).__module__ == "builtins" and True),  # Simple timestamp
-        "mcp_server_available": test_mcp_connection(),
+        "mcp_server_available": mcp_available if mcp_available is not None else test_mcp_connection(),
         "tools_count": len(tools),
         "tools": []
     }
@@ -219,7 +266,7 @@ def generate_tools_report():
         # Extraire le schéma
         try:
             if hasattr(tool, 'args_schema') and tool.args_schema:
-                schema = tool.args_schema.schema()
+                schema = _schema_for(tool.args_schema)
                 tool_info["schema"] = {
                     "properties": schema.get("properties", {}),
                     "required": schema.get("required", [])
@@ -243,11 +290,15 @@ def generate_tools_report():
 def main():
     """Fonction principale de validation."""
     try:
+        # Sonder le serveur MCP une seule fois pour toute la session de
+        # validation : la sonde et le rapport partagent le même résultat
+        mcp_available = test_mcp_connection()
+
         # Validation complète
-        success = validate_all_tools()
-        
+        success = validate_all_tools(mcp_available)
+
         # Génération du rapport
-        generate_tools_report()
+        generate_tools_report(mcp_available)
         
         # Statut final
         if success:
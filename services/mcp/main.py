@@ -1,4 +1,5 @@
 # src/main.py
+import functools
 import os
 import signal
 import sys
@@ -6,6 +7,31 @@ from typing import Optional, Literal
 from dotenv import load_dotenv
 from utils import create_mcp_from_openapi
 
+# Boucle d'événements uvloop optionnelle : sélecteurs libuv en C à la place
+# du sélecteur pur Python d'asyncio, gain net sur un serveur ASGI I/O-bound
+if sys.platform != "win32":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def _build_mcp():
+    """
+    Construit l'instance du serveur MCP une seule fois et la réutilise.
+
+    Le chargement du .env et le parsing de la spécification OpenAPI sont
+    mémoïsés : les différents points d'entrée (sync, async, instance) qui
+    s'enchaînent dans un même processus partagent la même instance.
+
+    Returns:
+        FastMCP: Instance du serveur MCP configuré
+    """
+    load_dotenv()
+    return create_mcp_from_openapi()
+
 
 def start_mcp_server(
     host: Optional[str] = None,
@@ -26,14 +52,11 @@ def start_mcp_server(
     Raises:
         Exception: En cas d'erreur lors du démarrage du serveur
     """
-    # Charger les variables d'environnement depuis un fichier .env
-    load_dotenv()
-    
     print("Création du serveur MCP à partir de la spécification OpenAPI...")
-    
-    # Créer l'instance du serveur en utilisant notre fonction utilitaire
-    mcp = create_mcp_from_openapi()
-    
+
+    # Créer (ou réutiliser) l'instance du serveur via le constructeur mémoïsé
+    mcp = _build_mcp()
+
     print(f"Serveur MCP '{mcp.name}' créé avec succès. Démarrage...")
     
     # Utiliser les paramètres fournis ou les variables d'environnement/valeurs par défaut
@@ -85,14 +108,11 @@ async def start_mcp_server_async(
     Raises:
         Exception: En cas d'erreur lors du démarrage du serveur
     """
-    # Charger les variables d'environnement depuis un fichier .env
-    load_dotenv()
-    
     print("Création du serveur MCP à partir de la spécification OpenAPI...")
-    
-    # Créer l'instance du serveur en utilisant notre fonction utilitaire
-    mcp = create_mcp_from_openapi()
-    
+
+    # Créer (ou réutiliser) l'instance du serveur via le constructeur mémoïsé
+    mcp = _build_mcp()
+
     print(f"Serveur MCP '{mcp.name}' créé avec succès. Démarrage asynchrone...")
     
     # Utiliser les paramètres fournis ou les variables d'environnement/valeurs par défaut
@@ -123,26 +143,33 @@ def get_mcp_instance():
     Raises:
         Exception: En cas d'erreur lors de la création du serveur
     """
-    # Charger les variables d'environnement depuis un fichier .env
-    load_dotenv()
-    
     print("Création de l'instance du serveur MCP...")
-    
-    # Créer l'instance du serveur en utilisant notre fonction utilitaire
-    mcp = create_mcp_from_openapi()
-    
+
+    # Créer (ou réutiliser) l'instance du serveur via le constructeur mémoïsé
+    mcp = _build_mcp()
+
     print(f"Instance MCP '{mcp.name}' créée avec succès.")
-    
+
     return mcp
 
 
 # Le bloc d'exécution principal pour l'usage autonome
 if __name__ == "__main__":
     # Mode d'exécution autonome - permet l'exécution directe du fichier
-    # Usage: python services/mcp/main.py
-    
+    # Usage: python services/mcp/main.py [--transport stdio|streamable-http|sse]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Lance le serveur MCP Légifrance")
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "streamable-http", "sse"],
+        default="streamable-http",
+        help="Transport du serveur MCP (stdio évite la pile TCP pour un client local)"
+    )
+    args = parser.parse_args()
+
     try:
-        start_mcp_server()
+        start_mcp_server(transport=args.transport)
     except Exception as e:
         print(f"❌ Erreur critique lors du démarrage : {e}")
         sys.exit(1)
\ No newline at end of file
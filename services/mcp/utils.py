@@ -1,15 +1,46 @@
 # src/utils.py
 import os
 import json
+import pickle
+import time
 import httpx
 from pathlib import Path
 from fastmcp import FastMCP
 
-def get_access_token() -> str:
+# Support HTTP/2 optionnel : les appels concurrents vers l'API PISTE se
+# multiplexent alors sur une seule connexion TLS
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Jeton d'accès mis en cache avec son échéance : un rechargement du serveur ne
+# refait l'aller-retour OAuth que si le jeton approche de son expiration
+_cached_token: str | None = None
+_token_expiry: float = 0.0
+
+# Marge de sécurité (en secondes) avant l'expiration réelle du jeton
+_TOKEN_REFRESH_MARGIN = 60.0
+
+
+def get_access_token(force: bool = False) -> str:
     """
     Récupère un jeton d'accès (access token) auprès du serveur OAuth de PISTE
     en utilisant les identifiants client (Client Credentials).
+
+    Le jeton est mis en cache en mémoire avec son échéance (``expires_in``) :
+    les appels suivants le réutilisent tant qu'il reste valide, évitant un
+    aller-retour OAuth complet à chaque rechargement.
+
+    Args:
+        force: Si True, ignore le cache et redemande un jeton frais
     """
+    global _cached_token, _token_expiry
+
+    if not force and _cached_token and time.time() < _token_expiry - _TOKEN_REFRESH_MARGIN:
+        return _cached_token
+
     client_id = os.getenv("OAUTH_CLIENT_ID")
     client_secret = os.getenv("OAUTH_CLIENT_SECRET")
     token_url = os.getenv("OAUTH_TOKEN_URL")
@@ -39,7 +70,11 @@ def get_access_token() -> str:
 
         if not access_token:
             raise ValueError("La réponse du serveur OAuth ne contient pas d'access_token.")
-            
+
+        # Mémoriser le jeton et son échéance (1h par défaut si absente)
+        _cached_token = access_token
+        _token_expiry = time.time() + float(token_data.get("expires_in", 3600))
+
         print("Jeton d'accès obtenu avec succès !")
         return access_token
 
@@ -52,6 +87,45 @@ def get_access_token() -> str:
         raise
 
 
+def _load_openapi_spec(spec_path: Path) -> dict:
+    """
+    Charge la spécification OpenAPI en mémorisant l'AST parsé sur disque.
+
+    Le parsing JSON du fichier (plusieurs centaines de Ko) est un coût CPU
+    pur payé à chaque démarrage : on conserve donc une version picklée à côté
+    du fichier source, invalidée par mtime, rechargée bien plus vite que le
+    re-parsing.
+
+    Args:
+        spec_path: Chemin du fichier openapi.json
+
+    Returns:
+        Spécification OpenAPI désérialisée
+    """
+    cache_path = spec_path.with_suffix(".pkl")
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= spec_path.stat().st_mtime:
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError):
+            # Cache corrompu : on retombe sur le parsing JSON complet
+            pass
+
+    # Lire les octets bruts et laisser json décoder l'UTF-8 en C : évite la
+    # couche codec texte de Python et ses petites lectures bufferisées
+    openapi_spec = json.loads(spec_path.read_bytes())
+
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(openapi_spec, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        # Répertoire en lecture seule : le cache est un simple bonus
+        pass
+
+    return openapi_spec
+
+
 def create_mcp_from_openapi() -> FastMCP:
     """
     Crée une instance de serveur FastMCP à partir de la spécification OpenAPI de Légifrance.
@@ -70,8 +144,7 @@ def create_mcp_from_openapi() -> FastMCP:
     if not spec_path.exists():
         raise FileNotFoundError(f"Fichier openapi.json non trouvé à l'emplacement : {spec_path}")
 
-    with open(spec_path, "r", encoding="utf-8") as f:
-        openapi_spec = json.load(f)
+    openapi_spec = _load_openapi_spec(spec_path)
 
     # 4. Configurer le client HTTP avec le jeton d'accès obtenu
     headers = {
@@ -80,7 +153,13 @@ def create_mcp_from_openapi() -> FastMCP:
         "accept": "application/json",
     }
     
-    http_client = httpx.AsyncClient(base_url=api_base_url, headers=headers)
+    http_client = httpx.AsyncClient(
+        base_url=api_base_url,
+        headers=headers,
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(30.0, connect=5.0),
+    )
 
     # 5. Générer le serveur MCP
     server_name = openapi_spec.get("info", {}).get("title", "Légifrance MCP Server")
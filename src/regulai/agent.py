@@ -5,7 +5,9 @@ Ce module assemble les nœuds définis dans graph.py pour créer l'agent LangGra
 complet avec persistance et streaming.
 """
 
-from typing import Optional, Any, Dict
+import asyncio
+
+from typing import Optional, Any, Dict, List
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, START, END
@@ -13,8 +15,9 @@ from langgraph.graph.message import add_messages
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph.graph import CompiledGraph
 
+from .checkpoint import create_compressed_checkpointer
 from .config import get_config
-from .graph import AgentState, call_model, call_tools, should_continue
+from .graph import AgentState, call_model, call_tools, route_after_tools, should_continue
 
 
 def create_agent(checkpointer: Optional[MemorySaver] = None) -> CompiledGraph:
@@ -53,12 +56,20 @@ def create_agent(checkpointer: Optional[MemorySaver] = None) -> CompiledGraph:
         },
     )
     
-    # Après les outils, retourner à l'agent
-    workflow.add_edge("tools", "agent")
+    # Après les outils, retourner à l'agent sauf si le tour a déjà conclu
+    # (court-circuit sur observations déjà vues)
+    workflow.add_conditional_edges(
+        "tools",
+        route_after_tools,
+        {
+            "agent": "agent",
+            "__end__": END,
+        },
+    )
     
-    # Compiler le graphe avec un checkpointer
+    # Compiler le graphe avec un checkpointer (sérialisation compressée par défaut)
     if checkpointer is None:
-        checkpointer = MemorySaver()
+        checkpointer = create_compressed_checkpointer()
     
     compiled_graph = workflow.compile(checkpointer=checkpointer)
     
@@ -108,6 +119,85 @@ def run_agent_conversation(
     return "Aucune réponse de l'agent"
 
 
+async def arun_agent_conversation(
+    message: str,
+    thread_id: str = "default-session",
+    agent: Optional[CompiledGraph] = None
+) -> str:
+    """
+    Variante asynchrone de run_agent_conversation.
+
+    À privilégier dans un contexte asynchrone : la boucle d'événements de
+    l'appelant est réutilisée (pas de pont sync/async par appel) et les
+    clients HTTP poolés restent partagés entre conversations.
+
+    Args:
+        message: Message de l'utilisateur
+        thread_id: ID de session pour la persistance
+        agent: Instance de l'agent (créée automatiquement si None)
+
+    Returns:
+        Réponse finale de l'agent
+
+    Raises:
+        ValueError: Si la configuration est invalide
+    """
+    if agent is None:
+        agent = create_agent()
+
+    # Créer le message utilisateur
+    user_message = HumanMessage(content=message)
+
+    # Configuration pour la persistance
+    config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+
+    # Invoquer l'agent de manière asynchrone
+    result = await agent.ainvoke(
+        {"messages": [user_message]},
+        config=config
+    )
+
+    # Récupérer la réponse finale
+    if result and "messages" in result:
+        last_message = result["messages"][-1]
+        if hasattr(last_message, 'content'):
+            return last_message.content
+
+    return "Aucune réponse de l'agent"
+
+
+async def arun_agent_conversations(
+    messages: List[str],
+    thread_prefix: str = "batch",
+    agent: Optional[CompiledGraph] = None
+) -> List[str]:
+    """
+    Lance plusieurs conversations indépendantes en parallèle avec l'agent.
+
+    Les requêtes LLM et les appels MCP des différentes questions recouvrent
+    leur latence mutuelle : le temps total approche celui de la conversation
+    la plus lente au lieu de la somme de toutes.
+
+    Args:
+        messages: Liste des messages utilisateur à traiter
+        thread_prefix: Préfixe des IDs de session (un thread par message)
+        agent: Instance de l'agent (créée automatiquement si None)
+
+    Returns:
+        Liste des réponses finales, dans l'ordre des messages d'entrée
+
+    Raises:
+        ValueError: Si la configuration est invalide
+    """
+    if agent is None:
+        agent = create_agent()
+
+    return list(await asyncio.gather(*(
+        arun_agent_conversation(message, f"{thread_prefix}-{i}", agent)
+        for i, message in enumerate(messages, 1)
+    )))
+
+
 def stream_agent_conversation(
     message: str,
     thread_id: str = "default-session", 
@@ -186,6 +276,47 @@ def stream_agent_conversation_with_tokens(
         yield token, metadata
 
 
+async def astream_agent_conversation_with_tokens(
+    message: str,
+    thread_id: str = "default-session",
+    agent: Optional[CompiledGraph] = None
+):
+    """
+    Variante asynchrone du streaming token par token avec l'agent RegulAI.
+
+    Chaque token est produit dès sa réception (coût O(1) par delta) et la
+    consommation asynchrone applique une contre-pression naturelle : la boucle
+    d'événements reste libre pour les appels d'outils MCP pendant le streaming.
+
+    Args:
+        message: Message de l'utilisateur
+        thread_id: ID de session pour la persistance
+        agent: Instance de l'agent (créée automatiquement si None)
+
+    Yields:
+        Tokens et métadonnées de streaming
+
+    Raises:
+        ValueError: Si la configuration est invalide
+    """
+    if agent is None:
+        agent = create_agent()
+
+    # Créer le message utilisateur
+    user_message = HumanMessage(content=message)
+
+    # Configuration pour la persistance
+    config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
+
+    # Streamer avec mode "messages" pour obtenir les tokens individuels
+    async for token, metadata in agent.astream(
+        {"messages": [user_message]},
+        config=config,
+        stream_mode="messages"
+    ):
+        yield token, metadata
+
+
 def main():
     """
     Fonction principale pour tester l'agent RegulAI.
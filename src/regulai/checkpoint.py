@@ -0,0 +1,108 @@
+"""
+Checkpointing compact pour l'agent RegulAI.
+
+Ce module fournit un sérialiseur de checkpoints qui compresse les états
+volumineux, réduisant la mémoire retenue par le checkpointer au fil des
+conversations longues.
+"""
+
+import zlib
+from typing import Any, Tuple
+
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+# Préfixe de type marquant une charge utile compressée
+_COMPRESSED_PREFIX = "zlib:"
+
+# Taille minimale (octets) avant compression : en dessous, le surcoût
+# de zlib dépasse le gain
+_MIN_COMPRESS_SIZE = 256
+
+
+class CompressedSerializer(JsonPlusSerializer):
+    """
+    Sérialiseur de checkpoints avec compression zlib des charges volumineuses.
+
+    Les petits checkpoints sont stockés tels quels ; au-delà d'un seuil, la
+    charge binaire est compressée et son type est préfixé pour permettre la
+    décompression transparente à la relecture.
+    """
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        """
+        Sérialise un objet et compresse la charge si elle est volumineuse.
+
+        Args:
+            obj: Objet à sérialiser (checkpoint ou métadonnées)
+
+        Returns:
+            Tuple (type, données binaires éventuellement compressées)
+        """
+        type_, data = super().dumps_typed(obj)
+        if len(data) >= _MIN_COMPRESS_SIZE:
+            compressed = zlib.compress(data, 6)
+            # Ne garder la version compressée que si elle est réellement plus petite
+            if len(compressed) < len(data):
+                return f"{_COMPRESSED_PREFIX}{type_}", compressed
+        return type_, data
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        """
+        Désérialise un objet, en décompressant la charge si nécessaire.
+
+        Args:
+            data: Tuple (type, données binaires) produit par dumps_typed
+
+        Returns:
+            Objet désérialisé
+        """
+        type_, payload = data
+        if type_.startswith(_COMPRESSED_PREFIX):
+            original_type = type_[len(_COMPRESSED_PREFIX):]
+            return super().loads_typed((original_type, zlib.decompress(payload)))
+        return super().loads_typed(data)
+
+
+def create_compressed_checkpointer() -> MemorySaver:
+    """
+    Crée un checkpointer en mémoire avec sérialisation compressée.
+
+    Returns:
+        MemorySaver utilisant le CompressedSerializer
+    """
+    return MemorySaver(serde=CompressedSerializer())
+
+
+def create_sqlite_checkpointer(db_path: str = "checkpoints.db") -> Any:
+    """
+    Crée un checkpointer SQLite persistant en mode WAL.
+
+    Contrairement à MemorySaver, seuls les deltas sont réécrits à chaque pas
+    (coût d'écriture quasi constant), la mémoire est bornée par le cache de
+    pages de l'OS et les conversations survivent aux redémarrages. Le mode
+    WAL évite de bloquer les lectures pendant les écritures de checkpoints.
+
+    Args:
+        db_path: Chemin du fichier SQLite (":memory:" pour un mode volatil)
+
+    Returns:
+        SqliteSaver utilisant le CompressedSerializer
+
+    Raises:
+        ImportError: Si le paquet langgraph-checkpoint-sqlite n'est pas installé
+    """
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError as e:
+        raise ImportError(
+            "Le checkpointer SQLite requiert le paquet langgraph-checkpoint-sqlite. "
+            "Installez-le avec : pip install 'regulai[sqlite]'"
+        ) from e
+
+    import sqlite3
+
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return SqliteSaver(conn, serde=CompressedSerializer())
@@ -5,6 +5,8 @@ Ce module gère toutes les variables d'environnement et paramètres de configura
 du projet de manière type-safe avec validation automatique.
 """
 
+import threading
+
 from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -103,7 +105,9 @@ class RegulAIConfig(BaseSettings):
         "env_file": ".env",
         "env_file_encoding": "utf-8",
         "case_sensitive": False,
-        "validate_assignment": True,
+        # Configuration immuable après construction : inutile de faire passer
+        # chaque accès d'attribut par les validateurs Pydantic
+        "frozen": True,
         "env_prefix": "",
     }
     
@@ -137,16 +141,13 @@ class RegulAIConfig(BaseSettings):
         Returns:
             Liste des noms de champs OAuth non configurés
         """
-        missing = []
-        if not self.oauth_client_id:
-            missing.append("OAUTH_CLIENT_ID")
-        if not self.oauth_client_secret:
-            missing.append("OAUTH_CLIENT_SECRET")
-        if not self.oauth_token_url:
-            missing.append("OAUTH_TOKEN_URL")
-        if not self.api_base_url:
-            missing.append("API_BASE_URL")
-        return missing
+        pairs = (
+            (self.oauth_client_id, "OAUTH_CLIENT_ID"),
+            (self.oauth_client_secret, "OAUTH_CLIENT_SECRET"),
+            (self.oauth_token_url, "OAUTH_TOKEN_URL"),
+            (self.api_base_url, "API_BASE_URL"),
+        )
+        return [name for value, name in pairs if not value]
 
 
 # Fonction pour créer une instance de configuration avec validation
@@ -165,32 +166,40 @@ def create_config() -> RegulAIConfig:
     return config
 
 
-# Instance globale de configuration (lazy loading)
+# Instance globale de configuration (lazy loading) et verrou d'initialisation
 _config: Optional[RegulAIConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> RegulAIConfig:
     """
     Récupère l'instance de configuration globale.
-    
+
+    L'initialisation est protégée par un verrou : des appels concurrents
+    (outils exécutés en parallèle) ne construisent qu'une seule instance et
+    ne relisent le fichier .env qu'une fois.
+
     Returns:
         Instance configurée de RegulAIConfig
     """
     global _config
     if _config is None:
-        _config = create_config()
+        with _config_lock:
+            if _config is None:
+                _config = create_config()
     return _config
 
 
 def reload_config() -> RegulAIConfig:
     """
     Recharge la configuration depuis les variables d'environnement.
-    
+
     Utile pour les tests ou les changements de configuration à l'exécution.
-    
+
     Returns:
         Nouvelle instance de RegulAIConfig
     """
     global _config
-    _config = create_config()
+    with _config_lock:
+        _config = create_config()
     return _config 
\ No newline at end of file
@@ -5,13 +5,18 @@ Ce module contient la structure de données de l'état de l'agent et les fonctio
 des nœuds qui composent le workflow ReAct.
 """
 
-from typing import TypedDict, Literal, List, Dict, Any
-from langchain_core.messages import BaseMessage, ToolMessage, AIMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, TypedDict, Literal, List, Dict, Any, Mapping, Optional
+from langchain_core.messages import BaseMessage, ToolMessage, AIMessage, SystemMessage
 
 from .config import get_config
 from .tools import get_available_tools
 
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
 
 # =============================================================================
 # ÉTAT DU GRAPHE (StateGraph)
@@ -27,20 +32,45 @@ class AgentState(TypedDict):
     messages: List[BaseMessage]
 
 
+# =============================================================================
+# PROMPT SYSTÈME
+# =============================================================================
+
+# Prompt système stable, toujours placé en tête de la liste de messages.
+# Un préfixe identique d'un tour ReAct à l'autre permet au fournisseur LLM
+# de réutiliser son cache de prompt (moins de tokens facturés, latence réduite).
+SYSTEM_PROMPT = SystemMessage(
+    content=(
+        "Tu es RegulAI, un assistant juridique spécialisé dans le droit français. "
+        "Tu utilises les outils Légifrance à ta disposition pour rechercher des "
+        "textes juridiques, récupérer des articles et naviguer dans les codes. "
+        "Lorsque plusieurs articles ou recherches sont nécessaires d'avance, "
+        "préfère les outils batch_get_article et batch_search_legifrance à des "
+        "appels unitaires répétés. "
+        "Réponds en français de manière précise en citant tes sources juridiques."
+    )
+)
+
+
 # =============================================================================
 # CONFIGURATION ET OUTILS
 # =============================================================================
 
-def get_configured_model() -> ChatGoogleGenerativeAI:
+def get_configured_model() -> "ChatGoogleGenerativeAI":
     """
     Crée une instance configurée du modèle Google Gemini.
-    
+
     Returns:
         Instance configurée de ChatGoogleGenerativeAI
-        
+
     Raises:
         ValueError: Si la clé API Google n'est pas configurée
     """
+    # Import différé : langchain_google_genai construit de nombreux modèles
+    # Pydantic à l'import, coût inutile pour les chemins qui n'appellent
+    # jamais le LLM (validation des outils, tests de connexion)
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     config = get_config()
     
     # Valider la clé API
@@ -50,11 +80,8 @@ def get_configured_model() -> ChatGoogleGenerativeAI:
             "Définissez la variable d'environnement ou copiez .env.example vers .env"
         )
     
-    # Définir la variable d'environnement si elle n'est pas déjà définie
-    import os
-    if not os.environ.get("GOOGLE_API_KEY"):
-        os.environ["GOOGLE_API_KEY"] = config.google_api_key
-    
+    # La clé est passée directement au constructeur : inutile de muter
+    # os.environ (état global surprenant dans les tests)
     return ChatGoogleGenerativeAI(
         model=config.model_name,
         temperature=config.model_temperature,
@@ -62,15 +89,46 @@ def get_configured_model() -> ChatGoogleGenerativeAI:
     )
 
 
-def get_tools_dict() -> Dict[str, Any]:
+# Modèle lié aux outils, construit une seule fois (lazy loading) : le schéma
+# JSON des outils n'est ainsi généré qu'au premier appel et non à chaque tour
+_bound_model: Any = None
+
+
+def get_bound_model() -> Any:
     """
-    Récupère les outils disponibles sous forme de dictionnaire.
-    
+    Récupère le modèle lié aux outils, construit au premier appel puis réutilisé.
+
     Returns:
-        Dictionnaire des outils indexés par nom
+        Runnable du modèle avec les outils liés
+
+    Raises:
+        ValueError: Si la clé API Google n'est pas configurée
     """
-    tools = get_available_tools()
-    return {tool.name: tool for tool in tools}
+    global _bound_model
+    if _bound_model is None:
+        _bound_model = get_configured_model().bind_tools(get_available_tools())
+    return _bound_model
+
+
+# Dictionnaire figé des outils, construit une seule fois (lazy loading)
+_tools_dict: Optional[Mapping[str, Any]] = None
+
+
+def get_tools_dict() -> Mapping[str, Any]:
+    """
+    Récupère les outils disponibles sous forme de dictionnaire figé.
+
+    Le dictionnaire est construit au premier appel puis réutilisé : la liste
+    des outils est statique et le mapping figé évite toute reconstruction
+    sur le chemin chaud de dispatch.
+
+    Returns:
+        Mapping en lecture seule des outils indexés par nom
+    """
+    global _tools_dict
+    if _tools_dict is None:
+        _tools_dict = MappingProxyType({tool.name: tool for tool in get_available_tools()})
+    return _tools_dict
 
 
 # =============================================================================
@@ -87,68 +145,119 @@ def call_model(state: AgentState) -> Dict[str, List[BaseMessage]]:
     Returns:
         Dictionnaire avec la nouvelle liste de messages incluant la réponse du modèle
     """
-    model = get_configured_model()
-    tools = get_available_tools()
-    
-    # Lier les outils au modèle et invoquer
-    response = model.bind_tools(tools).invoke(state["messages"])
-    
+    # Placer le prompt système en tête (sauf s'il y en a déjà un) pour
+    # conserver un préfixe stable et exploitable par le cache du fournisseur
+    messages = state["messages"]
+    if not messages or not isinstance(messages[0], SystemMessage):
+        messages = [SYSTEM_PROMPT, *messages]
+
+    # Invoquer le modèle déjà lié aux outils (schémas construits une seule fois)
+    response = get_bound_model().invoke(messages)
+
     # Retourner l'état mis à jour avec la réponse du modèle
     return {"messages": [response]}
 
 
+def _execute_tool_call(tool_call: Dict[str, Any], tools_dict: Mapping[str, Any]) -> str:
+    """
+    Exécute un appel d'outil et retourne son résultat formaté.
+
+    Args:
+        tool_call: Appel d'outil émis par le modèle (nom, arguments, id)
+        tools_dict: Dictionnaire des outils disponibles indexés par nom
+
+    Returns:
+        Résultat de l'outil ou message d'erreur
+    """
+    tool_name = tool_call["name"]
+
+    # Une seule recherche dans le dictionnaire des outils
+    tool = tools_dict.get(tool_name)
+    if tool is None:
+        # Outil non trouvé
+        return f"Outil '{tool_name}' non disponible"
+
+    try:
+        # Invoquer l'outil avec ses arguments
+        return str(tool.invoke(tool_call["args"]))
+    except Exception as e:
+        # En cas d'erreur, retourner un message d'erreur
+        return f"Erreur lors de l'exécution de {tool_name}: {e}"
+
+
 def call_tools(state: AgentState) -> Dict[str, List[BaseMessage]]:
     """
     Nœud qui exécute les outils appelés par le modèle.
-    
+
+    Les appels identiques d'un même tour (même outil, mêmes arguments) ne
+    sont exécutés qu'une fois, leur résultat étant rediffusé vers chaque
+    tool_call_id d'origine. Les appels uniques restants sont exécutés en
+    parallèle via un ThreadPoolExecutor : les requêtes HTTP vers le serveur
+    MCP recouvrent ainsi leur latence réseau (temps total ≈ max au lieu de
+    la somme).
+
     Args:
         state: État actuel de l'agent
-        
+
     Returns:
         Dictionnaire avec les messages des résultats des outils
     """
     # Récupérer le dernier message (doit être un AIMessage avec tool_calls)
     last_message = state["messages"][-1]
-    
+
     if not isinstance(last_message, AIMessage) or not last_message.tool_calls:
         return {"messages": []}
-    
+
     # Récupérer les outils disponibles
     tools_dict = get_tools_dict()
-    tool_messages = []
-    
-    # Exécuter chaque outil appelé
-    for tool_call in last_message.tool_calls:
-        tool_name = tool_call["name"]
-        
-        if tool_name in tools_dict:
-            tool = tools_dict[tool_name]
-            try:
-                # Invoquer l'outil avec ses arguments
-                result = tool.invoke(tool_call["args"])
-                
-                # Créer un ToolMessage avec le résultat
-                tool_message = ToolMessage(
-                    content=str(result),
-                    tool_call_id=tool_call["id"]
-                )
-                tool_messages.append(tool_message)
-                
-            except Exception as e:
-                # En cas d'erreur, créer un message d'erreur
-                error_message = ToolMessage(
-                    content=f"Erreur lors de l'exécution de {tool_name}: {e}",
-                    tool_call_id=tool_call["id"]
-                )
-                tool_messages.append(error_message)
-        else:
-            # Outil non trouvé
-            error_message = ToolMessage(
-                content=f"Outil '{tool_name}' non disponible",
-                tool_call_id=tool_call["id"]
+    tool_calls = last_message.tool_calls
+
+    # Dédupliquer les appels sur (nom, arguments canonisés)
+    keys: List[tuple] = []
+    unique_calls: Dict[tuple, Dict[str, Any]] = {}
+    for tool_call in tool_calls:
+        key = (
+            tool_call["name"],
+            json.dumps(tool_call["args"], sort_keys=True, ensure_ascii=False)
+        )
+        keys.append(key)
+        unique_calls.setdefault(key, tool_call)
+
+    # Exécuter chaque appel unique (en parallèle s'il y en a plusieurs)
+    if len(unique_calls) == 1:
+        key, tool_call = next(iter(unique_calls.items()))
+        results = {key: _execute_tool_call(tool_call, tools_dict)}
+    else:
+        with ThreadPoolExecutor(max_workers=len(unique_calls)) as executor:
+            contents = executor.map(
+                lambda tc: _execute_tool_call(tc, tools_dict), unique_calls.values()
             )
-            tool_messages.append(error_message)
-    
+            results = dict(zip(unique_calls.keys(), contents))
+
+    # Rediffuser chaque résultat vers son tool_call_id d'origine
+    tool_messages: List[BaseMessage] = [
+        ToolMessage(content=results[key], tool_call_id=tool_call["id"])
+        for key, tool_call in zip(keys, tool_calls)
+    ]
+
+    # Court-circuit : si toutes les observations du tour sont identiques à des
+    # résultats déjà présents dans la conversation, le modèle n'apprendra rien
+    # de nouveau — conclure directement pour économiser un aller-retour LLM
+    previous_observations = {
+        message.content
+        for message in state["messages"]
+        if isinstance(message, ToolMessage)
+    }
+    if previous_observations and all(
+        message.content in previous_observations for message in tool_messages
+    ):
+        tool_messages.append(AIMessage(
+            content=(
+                "Les outils n'ont retourné aucune information nouvelle par "
+                "rapport aux résultats déjà obtenus dans cette conversation."
+            )
+        ))
+
     return {"messages": tool_messages}
 
 
@@ -172,11 +281,33 @@ def should_continue(state: AgentState) -> Literal["tools", "__end__"]:
     # Si c'est un AIMessage avec des appels d'outils, continuer
     if isinstance(last_message, AIMessage) and last_message.tool_calls:
         return "tools"
-    
+
     # Sinon, terminer
     return "__end__"
 
 
+def route_after_tools(state: AgentState) -> Literal["agent", "__end__"]:
+    """
+    Détermine si l'agent doit repasser par le modèle après les outils.
+
+    Lorsque call_tools a conclu la conversation lui-même (court-circuit sur
+    observations déjà vues), le dernier message est un AIMessage et le tour
+    LLM supplémentaire est évité.
+
+    Args:
+        state: État actuel de l'agent
+
+    Returns:
+        "agent" pour réinvoquer le modèle, "__end__" pour terminer
+    """
+    last_message = state["messages"][-1]
+
+    if isinstance(last_message, AIMessage):
+        return "__end__"
+
+    return "agent"
+
+
 # =============================================================================
 # FONCTIONS UTILITAIRES
 # =============================================================================
@@ -5,6 +5,15 @@ Ce module contient la classe MCPClient pour la communication HTTP et les outils
 LangChain décorés avec @tool pour l'intégration avec l'agent LangGraph.
 """
 
+import asyncio
+import atexit
+import json
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import httpx
 from typing import List, Dict, Any, Optional
 from langchain_core.tools import tool
@@ -12,6 +21,14 @@ from pydantic import BaseModel, Field
 
 from .config import get_config
 
+# Support HTTP/2 optionnel : les appels d'outils parallèles se multiplexent
+# alors sur une seule connexion au lieu d'occuper chacun une connexion du pool
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 
 # =============================================================================
 # SCHÉMAS PYDANTIC POUR VALIDATION DES ARGUMENTS
@@ -35,6 +52,24 @@ class ArticleParams(BaseModel):
     )
 
 
+class BatchArticleParams(BaseModel):
+    """Paramètres pour récupérer plusieurs articles en un seul appel."""
+    article_ids: List[str] = Field(
+        description="Liste d'identifiants d'articles (ex: ['L3141-1', 'LEGIARTI000006900846'])"
+    )
+
+
+class BatchSearchParams(BaseModel):
+    """Paramètres pour lancer plusieurs recherches en un seul appel."""
+    queries: List[str] = Field(
+        description="Liste de requêtes de recherche en français"
+    )
+    max_results: int = Field(
+        default=10,
+        description="Nombre maximum de résultats à retourner par requête"
+    )
+
+
 class BrowseCodeParams(BaseModel):
     """Paramètres pour naviguer dans un code juridique."""
     code_name: str = Field(
@@ -58,10 +93,37 @@ class MCPClient:
     permettant d'abstraire les détails du protocole MCP pour les outils.
     """
     
+    # Limites du pool de connexions keep-alive partagé par les clients HTTP
+    _POOL_LIMITS = httpx.Limits(
+        max_keepalive_connections=32,
+        max_connections=64,
+        keepalive_expiry=60.0,
+    )
+
+    # Paramètres du cache de réponses (LRU + expiration)
+    _CACHE_MAX_SIZE = 1024
+    _CACHE_TTL = 3600.0  # secondes
+
+    # En-têtes constants des requêtes d'invocation
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+
+    # Politique de relance sur erreurs transitoires (réseau ou 5xx)
+    _RETRY_ATTEMPTS = 3
+    _RETRY_BASE_DELAY = 0.1  # secondes, doublé à chaque tentative
+    _RETRY_MAX_DELAY = 2.0  # secondes
+
+    # Disjoncteur : après ce nombre d'échecs consécutifs, les appels sont
+    # court-circuités pendant la fenêtre indiquée au lieu de retenter
+    _BREAKER_THRESHOLD = 5
+    _BREAKER_WINDOW = 30.0  # secondes
+
+    # Durée de fraîcheur des sondes santé/info du serveur
+    _PROBE_TTL = 60.0  # secondes
+
     def __init__(self, server_url: Optional[str] = None, timeout: Optional[int] = None):
         """
         Initialise le client MCP.
-        
+
         Args:
             server_url: URL du serveur MCP (utilise la config par défaut si None)
             timeout: Timeout en secondes (utilise la config par défaut si None)
@@ -69,7 +131,199 @@ class MCPClient:
         config = get_config()
         self.server_url = server_url or config.mcp_server_url
         self.timeout = timeout or config.mcp_timeout
-    
+        # URL d'invocation précalculée (point d'entrée principal du serveur)
+        self._invoke_url = f"{self.server_url}/invoke"
+        # Clients HTTP persistants (créés paresseusement) pour réutiliser les
+        # connexions TCP/TLS entre les appels d'outils au lieu de payer le
+        # handshake à chaque requête
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Boucle d'événements propriétaire du client asynchrone : le client
+        # est recréé si une autre boucle le redemande (voir _get_async_client)
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Verrou protégeant le cache, le disjoncteur et la création paresseuse
+        # du client : call_tool est invoqué en parallèle depuis les
+        # ThreadPoolExecutor du graphe et des outils groupés
+        self._lock = threading.Lock()
+        # Cache LRU des réponses réussies : (nom, args canonisés) -> (expiration, réponse)
+        self._cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+        # État du disjoncteur (échecs transitoires consécutifs)
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0
+        # Cache des sondes santé/info : clé -> (horodatage, valeur), avec
+        # revalidation en arrière-plan des valeurs périmées
+        self._probe_cache: Dict[str, tuple] = {}
+        self._probe_refreshing: set = set()
+
+    @staticmethod
+    def _cache_key(tool_name: str, tool_args: Dict[str, Any]) -> tuple:
+        """
+        Construit la clé de cache canonique d'un appel d'outil.
+
+        Les arguments sont sérialisés avec tri des clés pour que deux appels
+        identiques produisent la même clé quel que soit l'ordre des arguments.
+
+        Args:
+            tool_name: Nom de l'outil MCP
+            tool_args: Arguments de l'appel
+
+        Returns:
+            Tuple (nom de l'outil, arguments canonisés en JSON)
+        """
+        return (tool_name, json.dumps(tool_args, sort_keys=True, ensure_ascii=False))
+
+    def _cache_get(self, key: tuple) -> Optional[str]:
+        """
+        Récupère une réponse en cache si elle existe et n'est pas expirée.
+
+        Args:
+            key: Clé de cache produite par _cache_key
+
+        Returns:
+            Réponse en cache ou None (absente ou expirée)
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if time.monotonic() >= expires_at:
+                # pop() plutôt que del : un autre thread a pu évincer la clé
+                # entre le get() et la suppression
+                self._cache.pop(key, None)
+                return None
+            # Marquer l'entrée comme récemment utilisée (politique LRU)
+            self._cache.move_to_end(key)
+            return response
+
+    def _cache_put(self, key: tuple, response: str) -> None:
+        """
+        Stocke une réponse réussie dans le cache avec expiration.
+
+        Args:
+            key: Clé de cache produite par _cache_key
+            response: Réponse de l'outil à mettre en cache
+        """
+        with self._lock:
+            self._cache[key] = (time.monotonic() + self._CACHE_TTL, response)
+            self._cache.move_to_end(key)
+            # Évincer les entrées les plus anciennes si le cache déborde
+            while len(self._cache) > self._CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Vide le cache de réponses."""
+        with self._lock:
+            self._cache.clear()
+
+    @classmethod
+    def _retry_delay(cls, attempt: int) -> float:
+        """
+        Calcule le délai avant relance (exponentiel avec jitter complet).
+
+        Le jitter désynchronise les relances d'appels parallèles pour éviter
+        qu'elles ne refrappent le serveur toutes en même temps.
+
+        Args:
+            attempt: Numéro de la tentative qui vient d'échouer (0 pour la première)
+
+        Returns:
+            Délai d'attente en secondes
+        """
+        return random.uniform(0, min(cls._RETRY_MAX_DELAY, cls._RETRY_BASE_DELAY * (2 ** attempt)))
+
+    def _breaker_is_open(self) -> bool:
+        """Indique si le disjoncteur est ouvert (appels court-circuités)."""
+        return time.monotonic() < self._breaker_open_until
+
+    def _record_success(self) -> None:
+        """Réarme le disjoncteur après un échange abouti avec le serveur."""
+        with self._lock:
+            self._consecutive_failures = 0
+
+    def _record_failure(self) -> None:
+        """Comptabilise un échec transitoire et ouvre le disjoncteur au besoin."""
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self._BREAKER_THRESHOLD:
+                self._breaker_open_until = time.monotonic() + self._BREAKER_WINDOW
+
+    def _breaker_open_message(self) -> str:
+        """Message retourné lorsque le disjoncteur court-circuite un appel."""
+        return (
+            f"Serveur MCP ({self.server_url}) temporairement indisponible "
+            "après plusieurs échecs consécutifs, nouvel essai différé"
+        )
+
+    def _get_client(self) -> httpx.Client:
+        """
+        Récupère le client HTTP synchrone persistant (créé au premier appel).
+
+        Returns:
+            Client httpx avec pool de connexions keep-alive
+        """
+        # Création sous verrou : deux threads passant simultanément le test
+        # d'initialisation ouvriraient chacun leur client et en laisseraient
+        # un fuir sans fermeture
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    timeout=self.timeout,
+                    limits=self._POOL_LIMITS,
+                    http2=_HTTP2_AVAILABLE
+                )
+            return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Récupère le client HTTP asynchrone persistant (créé au premier appel).
+
+        Le client est lié à la boucle d'événements qui l'a créé : ses
+        connexions en pool deviennent inutilisables quand cette boucle est
+        fermée (ex. asyncio.run successifs dans le même processus), sans que
+        is_closed ne le signale. Un client neuf est donc créé dès que la
+        boucle courante n'est plus celle d'origine.
+
+        Returns:
+            Client httpx asynchrone avec pool de connexions keep-alive
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._async_client is None
+            or self._async_client.is_closed
+            or self._async_client_loop is not loop
+        ):
+            # L'ancien client (boucle fermée) est simplement abandonné : ses
+            # connexions ne peuvent plus être fermées proprement et seront
+            # libérées par le ramasse-miettes
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=self._POOL_LIMITS,
+                http2=_HTTP2_AVAILABLE
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    def __enter__(self) -> "MCPClient":
+        """Permet l'usage en gestionnaire de contexte (fermeture garantie)."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Ferme les clients HTTP à la sortie du bloc with."""
+        self.close()
+
+    def close(self) -> None:
+        """Ferme les clients HTTP persistants et libère les connexions."""
+        if self._client is not None and not self._client.is_closed:
+            self._client.close()
+        if self._async_client is not None and not self._async_client.is_closed:
+            try:
+                asyncio.run(self._async_client.aclose())
+            except RuntimeError:
+                # Une boucle d'événements est déjà active : les connexions
+                # seront libérées à la fin du processus
+                pass
+
     def call_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> str:
         """
         Appelle un outil sur le serveur MCP via HTTP.
@@ -84,114 +338,266 @@ class MCPClient:
         Raises:
             Exception: En cas d'erreur de communication ou de serveur
         """
-        try:
-            # Préparer la requête selon le format attendu par le serveur MCP
-            payload = {
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": tool_args
-                }
+        # Servir depuis le cache si un appel identique a déjà réussi
+        cache_key = self._cache_key(tool_name, tool_args)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Disjoncteur ouvert : court-circuiter sans solliciter le serveur
+        if self._breaker_is_open():
+            return self._breaker_open_message()
+
+        # Préparer la requête selon le format attendu par le serveur MCP
+        payload = {
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": tool_args
             }
-            
-            # Faire la requête HTTP au serveur MCP
-            with httpx.Client(timeout=self.timeout) as client:
+        }
+
+        last_error = ""
+        for attempt in range(self._RETRY_ATTEMPTS):
+            try:
+                # Faire la requête HTTP via le client persistant (connexions réutilisées)
+                client = self._get_client()
                 response = client.post(
-                    f"{self.server_url}/invoke",  # Point d'entrée principal du serveur
+                    self._invoke_url,
+                    json=payload,
+                    headers=self._JSON_HEADERS
+                )
+
+                if response.status_code == 200:
+                    result = response.json()
+                    parsed = self._parse_mcp_response(result)
+                    self._record_success()
+                    # Seules les réponses réussies sont mises en cache
+                    self._cache_put(cache_key, parsed)
+                    return parsed
+
+                if response.status_code < 500:
+                    # Erreur applicative (4xx) : le serveur répond, inutile
+                    # de relancer ou d'ouvrir le disjoncteur
+                    self._record_success()
+                    return self._handle_error_response(response)
+
+                # 5xx transitoire : relancer après un délai avec jitter
+                last_error = self._handle_error_response(response)
+
+            except httpx.RequestError as e:
+                last_error = f"Erreur de connexion au serveur MCP ({self.server_url}): {e}"
+            except Exception as e:
+                return f"Erreur lors de l'appel de l'outil {tool_name}: {e}"
+
+            if attempt < self._RETRY_ATTEMPTS - 1:
+                time.sleep(self._retry_delay(attempt))
+
+        self._record_failure()
+        return last_error
+
+    async def acall_tool(self, tool_name: str, tool_args: Dict[str, Any]) -> str:
+        """
+        Variante asynchrone de call_tool pour les appels d'outils concurrents.
+
+        Plusieurs appels peuvent ainsi recouvrir leur latence réseau au lieu
+        d'être sérialisés sur la boucle d'événements.
+
+        Args:
+            tool_name: Nom de l'outil MCP à appeler
+            tool_args: Arguments à passer à l'outil
+
+        Returns:
+            Réponse de l'outil sous forme de chaîne formatée
+        """
+        # Servir depuis le cache si un appel identique a déjà réussi
+        cache_key = self._cache_key(tool_name, tool_args)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Disjoncteur ouvert : court-circuiter sans solliciter le serveur
+        if self._breaker_is_open():
+            return self._breaker_open_message()
+
+        payload = {
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": tool_args
+            }
+        }
+
+        last_error = ""
+        for attempt in range(self._RETRY_ATTEMPTS):
+            try:
+                client = self._get_async_client()
+                response = await client.post(
+                    self._invoke_url,
                     json=payload,
-                    headers={"Content-Type": "application/json"}
+                    headers=self._JSON_HEADERS
                 )
-                
+
                 if response.status_code == 200:
                     result = response.json()
-                    return self._parse_mcp_response(result)
-                else:
+                    parsed = self._parse_mcp_response(result)
+                    self._record_success()
+                    # Seules les réponses réussies sont mises en cache
+                    self._cache_put(cache_key, parsed)
+                    return parsed
+
+                if response.status_code < 500:
+                    # Erreur applicative (4xx) : le serveur répond, inutile
+                    # de relancer ou d'ouvrir le disjoncteur
+                    self._record_success()
                     return self._handle_error_response(response)
-                    
-        except httpx.RequestError as e:
-            return f"Erreur de connexion au serveur MCP ({self.server_url}): {e}"
-        except Exception as e:
-            return f"Erreur lors de l'appel de l'outil {tool_name}: {e}"
+
+                # 5xx transitoire : relancer après un délai avec jitter
+                last_error = self._handle_error_response(response)
+
+            except httpx.RequestError as e:
+                last_error = f"Erreur de connexion au serveur MCP ({self.server_url}): {e}"
+            except Exception as e:
+                return f"Erreur lors de l'appel de l'outil {tool_name}: {e}"
+
+            if attempt < self._RETRY_ATTEMPTS - 1:
+                await asyncio.sleep(self._retry_delay(attempt))
+
+        self._record_failure()
+        return last_error
     
-    def _parse_mcp_response(self, result: Dict[str, Any]) -> str:
+    @staticmethod
+    def _parse_mcp_response(result: Dict[str, Any]) -> str:
         """
         Parse la réponse du serveur MCP selon son format.
-        
+
         Args:
             result: Réponse JSON du serveur MCP
-            
+
         Returns:
             Contenu formaté de la réponse
         """
-        # Parser la réponse MCP selon son format
-        if "result" in result:
-            content = result["result"]
-            
-            # Si la réponse contient du contenu structuré
-            if isinstance(content, dict) and "content" in content:
-                content_data = content["content"]
-                
-                # Gérer les réponses avec liste de contenus
-                if isinstance(content_data, list) and len(content_data) > 0:
-                    first_item = content_data[0]
-                    if isinstance(first_item, dict) and "text" in first_item:
-                        return first_item["text"]
-                    else:
-                        return str(first_item)
-                else:
-                    return str(content_data)
-            else:
-                return str(content)
-        else:
+        # Chemin heureux (EAFP) : trois accès dict directs, sans isinstance
+        try:
+            return result["result"]["content"][0]["text"]
+        except (KeyError, TypeError, IndexError):
+            pass
+
+        # Chemin plat : extraire result -> content -> premier élément -> text
+        if "result" not in result:
             return f"Réponse inattendue du serveur MCP: {result}"
+
+        content = result["result"]
+        if isinstance(content, dict) and "content" in content:
+            data = content["content"]
+            if isinstance(data, list) and data:
+                item = data[0]
+                return item["text"] if isinstance(item, dict) and "text" in item else str(item)
+            return str(data)
+        return str(content)
     
-    def _handle_error_response(self, response: httpx.Response) -> str:
+    @staticmethod
+    def _handle_error_response(response: httpx.Response) -> str:
         """
         Gère les réponses d'erreur HTTP.
-        
+
         Args:
             response: Réponse HTTP d'erreur
-            
+
         Returns:
             Message d'erreur formaté
         """
-        error_msg = f"Erreur HTTP {response.status_code}"
+        # Lire le corps une seule fois et n'appliquer qu'un seul décodage
+        raw = response.content
         try:
-            error_detail = response.json()
-            error_msg += f": {error_detail}"
-        except:
-            error_msg += f": {response.text}"
-        return error_msg
+            error_detail = json.loads(raw)
+        except ValueError:
+            # Corps non-JSON : tronquer et décoder en remplaçant les octets invalides
+            error_detail = raw[:512].decode("utf-8", errors="replace")
+        return f"Erreur HTTP {response.status_code}: {error_detail}"
     
+    def _cached_probe(self, key: str, probe) -> Any:
+        """
+        Sert une sonde serveur depuis le cache, façon stale-while-revalidate.
+
+        Une valeur fraîche est retournée directement ; une valeur périmée est
+        servie immédiatement pendant qu'un thread d'arrière-plan la revalide,
+        de sorte qu'aucun appelant ne bloque sur un aller-retour de sonde
+        après le premier.
+
+        Args:
+            key: Identifiant de la sonde ("health", "info")
+            probe: Fonction effectuant la sonde réelle
+
+        Returns:
+            Dernière valeur connue de la sonde
+        """
+        entry = self._probe_cache.get(key)
+        if entry is not None:
+            timestamp, value = entry
+            if time.monotonic() - timestamp < self._PROBE_TTL:
+                return value
+            # Valeur périmée : revalider en arrière-plan sans bloquer
+            if key not in self._probe_refreshing:
+                self._probe_refreshing.add(key)
+                threading.Thread(
+                    target=self._refresh_probe, args=(key, probe), daemon=True
+                ).start()
+            return value
+
+        # Première sonde : aller-retour bloquant puis mise en cache
+        value = probe()
+        self._probe_cache[key] = (time.monotonic(), value)
+        return value
+
+    def _refresh_probe(self, key: str, probe) -> None:
+        """Revalide une sonde en arrière-plan et met à jour le cache."""
+        try:
+            self._probe_cache[key] = (time.monotonic(), probe())
+        finally:
+            self._probe_refreshing.discard(key)
+
+    def _probe_health(self) -> bool:
+        """Sonde l'endpoint /health du serveur MCP."""
+        try:
+            response = self._get_client().get(f"{self.server_url}/health")
+            return response.status_code == 200
+        except (httpx.RequestError, httpx.HTTPStatusError):
+            return False
+
+    def _probe_info(self) -> Optional[Dict[str, Any]]:
+        """Sonde l'endpoint /info du serveur MCP."""
+        try:
+            response = self._get_client().get(f"{self.server_url}/info")
+            if response.status_code == 200:
+                return response.json()
+        except (httpx.RequestError, httpx.HTTPStatusError):
+            pass
+        return None
+
     def test_connection(self) -> bool:
         """
         Teste la connexion au serveur MCP.
-        
+
+        Le résultat est mis en cache pendant _PROBE_TTL secondes, une valeur
+        périmée étant servie pendant sa revalidation en arrière-plan.
+
         Returns:
             True si la connexion fonctionne, False sinon
         """
-        try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(f"{self.server_url}/health")
-                return response.status_code == 200
-        except:
-            return False
-    
+        return self._cached_probe("health", self._probe_health)
+
     def get_server_info(self) -> Optional[Dict[str, Any]]:
         """
         Récupère les informations du serveur MCP.
-        
+
+        Le résultat est mis en cache pendant _PROBE_TTL secondes, une valeur
+        périmée étant servie pendant sa revalidation en arrière-plan.
+
         Returns:
             Informations du serveur ou None en cas d'erreur
         """
-        try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(f"{self.server_url}/info")
-                if response.status_code == 200:
-                    return response.json()
-        except:
-            pass
-        return None
+        return self._cached_probe("info", self._probe_info)
 
 
 # Instance globale du client MCP
@@ -211,10 +617,32 @@ def get_mcp_client() -> MCPClient:
     return _mcp_client
 
 
+@atexit.register
+def _close_mcp_client() -> None:
+    """Ferme le client MCP global à la sortie du processus."""
+    if _mcp_client is not None:
+        _mcp_client.close()
+
+
 # =============================================================================
 # OUTILS LÉGIFRANCE AVEC DÉCORATEUR @tool
 # =============================================================================
 
+def _normalize_query(query: str) -> str:
+    """
+    Normalise une requête de recherche (espaces superflus supprimés).
+
+    Deux formulations équivalentes à l'espacement près produisent ainsi la
+    même clé dans le cache de réponses.
+
+    Args:
+        query: Requête de recherche brute
+
+    Returns:
+        Requête normalisée
+    """
+    return " ".join(query.split())
+
 @tool("search_legifrance", args_schema=SearchParams, parse_docstring=True)
 def search_legifrance(query: str, max_results: int = 10) -> str:
     """
@@ -232,11 +660,23 @@ def search_legifrance(query: str, max_results: int = 10) -> str:
     """
     client = get_mcp_client()
     return client.call_tool("search_legifrance", {
-        "query": query,
+        "query": _normalize_query(query),
+        "max_results": max_results
+    })
+
+
+async def _asearch_legifrance(query: str, max_results: int = 10) -> str:
+    """Variante asynchrone de search_legifrance (utilisée via ainvoke)."""
+    client = get_mcp_client()
+    return await client.acall_tool("search_legifrance", {
+        "query": _normalize_query(query),
         "max_results": max_results
     })
 
 
+search_legifrance.coroutine = _asearch_legifrance
+
+
 @tool("get_article", args_schema=ArticleParams, parse_docstring=True)  
 def get_article(article_id: str) -> str:
     """
@@ -257,6 +697,17 @@ def get_article(article_id: str) -> str:
     })
 
 
+async def _aget_article(article_id: str) -> str:
+    """Variante asynchrone de get_article (utilisée via ainvoke)."""
+    client = get_mcp_client()
+    return await client.acall_tool("get_article", {
+        "article_id": article_id
+    })
+
+
+get_article.coroutine = _aget_article
+
+
 @tool("browse_code", args_schema=BrowseCodeParams, parse_docstring=True)
 def browse_code(code_name: str, section: Optional[str] = None) -> str:
     """
@@ -279,18 +730,201 @@ def browse_code(code_name: str, section: Optional[str] = None) -> str:
     })
 
 
+async def _abrowse_code(code_name: str, section: Optional[str] = None) -> str:
+    """Variante asynchrone de browse_code (utilisée via ainvoke)."""
+    client = get_mcp_client()
+    return await client.acall_tool("browse_code", {
+        "code_name": code_name,
+        "section": section
+    })
+
+
+browse_code.coroutine = _abrowse_code
+
+
+def _format_batch_results(label: str, keys: List[str], results: List[str]) -> str:
+    """
+    Assemble les résultats d'un appel groupé en une seule réponse lisible.
+
+    Args:
+        label: Libellé de chaque section (ex: "Article", "Recherche")
+        keys: Identifiants ou requêtes d'origine
+        results: Résultats correspondants, dans le même ordre
+
+    Returns:
+        Sections concaténées, une par élément du lot
+    """
+    sections = [
+        f"=== {label} {key} ===\n{result}"
+        for key, result in zip(keys, results)
+    ]
+    return "\n\n".join(sections)
+
+
+@tool("batch_get_article", args_schema=BatchArticleParams, parse_docstring=True)
+def batch_get_article(article_ids: List[str]) -> str:
+    """
+    Récupère plusieurs articles juridiques en un seul appel.
+
+    À préférer à get_article dès que plusieurs identifiants sont connus
+    d'avance : les récupérations sont effectuées en parallèle côté client.
+
+    Args:
+        article_ids: Liste d'identifiants d'articles (ex: ["L3141-1", "LEGIARTI000006900846"])
+
+    Returns:
+        Contenus des articles demandés, une section par article
+    """
+    if not article_ids:
+        return "Aucun identifiant d'article fourni"
+
+    client = get_mcp_client()
+    if len(article_ids) == 1:
+        results = [client.call_tool("get_article", {"article_id": article_ids[0]})]
+    else:
+        with ThreadPoolExecutor(max_workers=len(article_ids)) as executor:
+            results = list(executor.map(
+                lambda article_id: client.call_tool("get_article", {"article_id": article_id}),
+                article_ids
+            ))
+
+    return _format_batch_results("Article", article_ids, results)
+
+
+async def _abatch_get_article(article_ids: List[str]) -> str:
+    """Variante asynchrone de batch_get_article (utilisée via ainvoke)."""
+    if not article_ids:
+        return "Aucun identifiant d'article fourni"
+
+    client = get_mcp_client()
+    results = list(await asyncio.gather(*(
+        client.acall_tool("get_article", {"article_id": article_id})
+        for article_id in article_ids
+    )))
+
+    return _format_batch_results("Article", article_ids, results)
+
+
+batch_get_article.coroutine = _abatch_get_article
+
+
+@tool("batch_search_legifrance", args_schema=BatchSearchParams, parse_docstring=True)
+def batch_search_legifrance(queries: List[str], max_results: int = 10) -> str:
+    """
+    Lance plusieurs recherches Légifrance en un seul appel.
+
+    À préférer à search_legifrance dès que plusieurs requêtes sont connues
+    d'avance : les recherches sont effectuées en parallèle côté client.
+
+    Args:
+        queries: Liste de requêtes de recherche en français
+        max_results: Nombre maximum de résultats à retourner par requête (défaut: 10)
+
+    Returns:
+        Résultats des recherches, une section par requête
+    """
+    if not queries:
+        return "Aucune requête de recherche fournie"
+
+    client = get_mcp_client()
+    normalized = [_normalize_query(query) for query in queries]
+    if len(normalized) == 1:
+        results = [client.call_tool("search_legifrance", {
+            "query": normalized[0],
+            "max_results": max_results
+        })]
+    else:
+        with ThreadPoolExecutor(max_workers=len(normalized)) as executor:
+            results = list(executor.map(
+                lambda query: client.call_tool("search_legifrance", {
+                    "query": query,
+                    "max_results": max_results
+                }),
+                normalized
+            ))
+
+    return _format_batch_results("Recherche", normalized, results)
+
+
+async def _abatch_search_legifrance(queries: List[str], max_results: int = 10) -> str:
+    """Variante asynchrone de batch_search_legifrance (utilisée via ainvoke)."""
+    if not queries:
+        return "Aucune requête de recherche fournie"
+
+    client = get_mcp_client()
+    normalized = [_normalize_query(query) for query in queries]
+    results = list(await asyncio.gather(*(
+        client.acall_tool("search_legifrance", {
+            "query": query,
+            "max_results": max_results
+        })
+        for query in normalized
+    )))
+
+    return _format_batch_results("Recherche", normalized, results)
+
+
+batch_search_legifrance.coroutine = _abatch_search_legifrance
+
+
 # =============================================================================
 # FONCTIONS UTILITAIRES
 # =============================================================================
 
-def get_available_tools() -> List:
+# Tuple figé des outils exposés à l'agent : construit une seule fois à
+# l'import, réutilisable par identité par les appelants
+_AVAILABLE_TOOLS = (
+    search_legifrance,
+    get_article,
+    browse_code,
+    batch_get_article,
+    batch_search_legifrance,
+)
+
+
+def get_available_tools() -> tuple:
     """
-    Retourne la liste des outils disponibles pour l'agent.
-    
+    Retourne les outils disponibles pour l'agent.
+
     Returns:
-        Liste des fonctions-outils décorées avec @tool
+        Tuple figé des fonctions-outils décorées avec @tool
+    """
+    return _AVAILABLE_TOOLS
+
+
+# Schémas JSON des arguments des outils, calculés une seule fois (lazy loading)
+_tool_args_schemas: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def get_tool_args_schemas() -> Dict[str, Dict[str, Any]]:
+    """
+    Récupère les schémas JSON des arguments de chaque outil.
+
+    Les schémas sont statiques : ils sont dérivés des modèles Pydantic au
+    premier appel puis réutilisés, évitant de refaire la conversion
+    Pydantic → dict à chaque consultation.
+
+    Returns:
+        Dictionnaire {nom de l'outil: schéma JSON de ses arguments}
+    """
+    global _tool_args_schemas
+    if _tool_args_schemas is None:
+        _tool_args_schemas = {
+            tool.name: tool.args_schema.model_json_schema()
+            for tool in get_available_tools()
+        }
+    return _tool_args_schemas
+
+
+def clear_response_cache() -> None:
+    """
+    Vide le cache de réponses du client MCP global.
+
+    Utile pour les tests ou après une mise à jour connue des données côté
+    Légifrance.
     """
-    return [search_legifrance, get_article, browse_code]
+    if _mcp_client is not None:
+        _mcp_client.clear_cache()
 
 
 def test_mcp_connection() -> bool:
@@ -14,16 +14,34 @@ Usage:
 import asyncio
 import atexit
 import argparse
+import json
 import os
+import random
+import select
 import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
 import httpx
 
+# Support HTTP/2 optionnel pour le client de sonde (même garde que dans
+# src/regulai/tools.py)
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Corps du ping MCP, constant : encodé une seule fois au chargement plutôt
+# que repassé par json.dumps à chaque tentative de sonde
+_PING_BODY = json.dumps({"method": "ping", "params": {}}).encode("utf-8")
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class RegulAILauncher:
     """Lanceur principal pour RegulAI - gère le serveur MCP et l'application Streamlit."""
@@ -55,6 +73,23 @@ class RegulAILauncher:
         # Références vers les processus
         self.mcp_process: Optional[subprocess.Popen] = None
         self.streamlit_process: Optional[subprocess.Popen] = None
+
+        # Descripteur pidfd du processus MCP (réveil immédiat si le fils meurt)
+        self._mcp_pidfd: Optional[int] = None
+
+        # Client HTTP persistant des sondes de santé (créé paresseusement)
+        self._probe_client: Optional[httpx.Client] = None
+
+        # Chemins résolus une seule fois (un seul stat() par fichier)
+        self._python = sys.executable
+        self._mcp_main = Path("services/mcp/main.py")
+        self._streamlit_app = Path("streamlit_app.py")
+
+        # Dernières lignes de log du serveur MCP, pompées en continu par des
+        # threads d'arrière-plan pour éviter que le tampon du tube ne se
+        # remplisse et ne bloque le serveur en pleine requête
+        self._mcp_stdout_tail: deque = deque(maxlen=200)
+        self._mcp_stderr_tail: deque = deque(maxlen=200)
         
         # URLs des services
         self.mcp_url = f"http://{host}:{mcp_port}"
@@ -76,53 +111,167 @@ class RegulAILauncher:
     def cleanup(self):
         """Nettoie les processus en cours."""
         print("🧹 Nettoyage des processus...")
+
+        # Fermer le client de sonde persistant
+        if self._probe_client is not None and not self._probe_client.is_closed:
+            self._probe_client.close()
         
-        # Arrêter Streamlit en premier (moins critique)
-        if self.streamlit_process and self.streamlit_process.poll() is None:
-            print("   ⏹️  Arrêt de Streamlit...")
-            try:
-                self.streamlit_process.terminate()
-                self.streamlit_process.wait(timeout=5)
-                print("   ✅ Streamlit arrêté")
-            except subprocess.TimeoutExpired:
-                print("   ⚠️  Timeout - forçage de l'arrêt de Streamlit")
-                self.streamlit_process.kill()
-                self.streamlit_process.wait()
-            except Exception as e:
-                print(f"   ❌ Erreur lors de l'arrêt de Streamlit: {e}")
-        
-        # Arrêter le serveur MCP
-        if self.mcp_process and self.mcp_process.poll() is None:
-            print("   ⏹️  Arrêt du serveur MCP...")
+        # Envoyer SIGTERM aux deux processus d'abord : leurs arrêts gracieux
+        # se déroulent en parallèle sous un budget partagé de 5 secondes,
+        # au lieu de 5 secondes chacun en séquence
+        stopping = []
+        for label, process in (
+            ("Streamlit", self.streamlit_process),
+            ("Serveur MCP", self.mcp_process),
+        ):
+            if process and process.poll() is None:
+                print(f"   ⏹️  Arrêt de {label}...")
+                try:
+                    process.terminate()
+                    stopping.append((label, process))
+                except Exception as e:
+                    print(f"   ❌ Erreur lors de l'arrêt de {label}: {e}")
+
+        deadline = time.monotonic() + 5
+        for label, process in stopping:
             try:
-                self.mcp_process.terminate()
-                self.mcp_process.wait(timeout=5)
-                print("   ✅ Serveur MCP arrêté")
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+                print(f"   ✅ {label} arrêté")
             except subprocess.TimeoutExpired:
-                print("   ⚠️  Timeout - forçage de l'arrêt du serveur MCP")
-                self.mcp_process.kill()
-                self.mcp_process.wait()
+                print(f"   ⚠️  Timeout - forçage de l'arrêt de {label}")
+                process.kill()
+                process.wait()
             except Exception as e:
-                print(f"   ❌ Erreur lors de l'arrêt du serveur MCP: {e}")
+                print(f"   ❌ Erreur lors de l'arrêt de {label}: {e}")
     
+    @staticmethod
+    def _start_pump(stream, buffer: deque) -> None:
+        """
+        Lance un thread démon qui vide un tube du processus fils en continu.
+
+        Sans drainage, le tampon du tube (~64 Ko) finit par se remplir et le
+        write() du logger du serveur MCP bloque, gelant le serveur. Les
+        dernières lignes sont conservées dans un tampon circulaire borné
+        pour le diagnostic en cas de crash.
+
+        Le flux est lu en binaire : aucun décodage UTF-8 n'est payé pendant le
+        fonctionnement normal, les lignes ne sont décodées qu'à l'affichage
+        du diagnostic de crash.
+
+        Args:
+            stream: Flux binaire du processus fils (stdout ou stderr)
+            buffer: Tampon circulaire recevant les lignes lues (octets)
+        """
+        def _pump():
+            try:
+                for line in stream:
+                    buffer.append(line.rstrip(b'\n'))
+            except (ValueError, OSError):
+                # Flux fermé pendant la lecture (arrêt du processus)
+                pass
+
+        threading.Thread(target=_pump, daemon=True).start()
+
+    def _supervise_children(self) -> None:
+        """
+        Bloque jusqu'à la sortie d'un des deux processus fils (Linux).
+
+        Les pidfds des deux fils sont surveillés par un poll() sans timeout :
+        aucun réveil CPU périodique tant que tout va bien, et la mort d'un
+        processus est détectée immédiatement au lieu d'attendre le prochain
+        tour de sondage.
+        """
+        poller = select.poll()
+        fds: dict = {}
+        try:
+            for message, process in (
+                ("⚠️  Le serveur MCP s'est arrêté", self.mcp_process),
+                ("⚠️  L'application Streamlit s'est arrêtée", self.streamlit_process),
+            ):
+                if process is not None and process.poll() is None:
+                    fd = os.pidfd_open(process.pid)
+                    fds[fd] = message
+                    poller.register(fd, select.POLLIN)
+
+            if not fds:
+                return
+
+            # Bloquer jusqu'à ce qu'un fils meure (ou qu'un signal interrompe)
+            for fd, _ in poller.poll():
+                print(fds[fd])
+        finally:
+            for fd in fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+
+    def _get_probe_client(self) -> httpx.Client:
+        """
+        Récupère le client HTTP persistant des sondes (créé au premier appel).
+
+        Returns:
+            Client httpx avec petit pool keep-alive, fermé dans cleanup()
+        """
+        if self._probe_client is None or self._probe_client.is_closed:
+            self._probe_client = httpx.Client(
+                timeout=5.0,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=4),
+            )
+        return self._probe_client
+
+    def _wait_or_child_exit(self, delay: float) -> None:
+        """
+        Attend `delay` secondes, avec réveil immédiat si le processus MCP meurt.
+
+        Sur Linux, le descripteur pidfd du fils est surveillé via poll() : la
+        mort du serveur est détectée en quelques millisecondes au lieu
+        d'attendre la fin de l'intervalle de sommeil. Repli sur time.sleep
+        si pidfd_open n'est pas disponible (Windows, anciens noyaux).
+
+        Args:
+            delay: Durée maximale d'attente en secondes
+        """
+        if self.mcp_process is None or not hasattr(os, "pidfd_open"):
+            time.sleep(delay)
+            return
+
+        if self._mcp_pidfd is None:
+            try:
+                self._mcp_pidfd = os.pidfd_open(self.mcp_process.pid)
+            except OSError:
+                time.sleep(delay)
+                return
+
+        poller = select.poll()
+        poller.register(self._mcp_pidfd, select.POLLIN)
+        poller.poll(int(delay * 1000))
+
+    def _close_pidfd(self) -> None:
+        """Ferme le descripteur pidfd du processus MCP s'il est ouvert."""
+        if self._mcp_pidfd is not None:
+            try:
+                os.close(self._mcp_pidfd)
+            except OSError:
+                pass
+            self._mcp_pidfd = None
+
     def _get_python_executable(self) -> str:
         """Trouve l'exécutable Python approprié."""
-        # Utiliser le même Python que celui qui exécute ce script
-        return sys.executable
-    
+        # Utiliser le même Python que celui qui exécute ce script (résolu à l'init)
+        return self._python
+
     def _validate_paths(self) -> bool:
         """Valide que les fichiers requis existent."""
-        mcp_main_path = Path("services/mcp/main.py")
-        streamlit_app_path = Path("streamlit_app.py")
-        
-        if not mcp_main_path.exists():
-            print(f"❌ Fichier MCP non trouvé: {mcp_main_path}")
+        if not self._mcp_main.exists():
+            print(f"❌ Fichier MCP non trouvé: {self._mcp_main}")
             return False
-        
-        if not streamlit_app_path.exists():
-            print(f"❌ Fichier Streamlit non trouvé: {streamlit_app_path}")
+
+        if not self._streamlit_app.exists():
+            print(f"❌ Fichier Streamlit non trouvé: {self._streamlit_app}")
             return False
-        
+
         return True
     
     def start_mcp_server(self) -> bool:
@@ -142,18 +291,21 @@ class RegulAILauncher:
             
             # Lancer le serveur MCP
             self.mcp_process = subprocess.Popen(
-                [self._get_python_executable(), "services/mcp/main.py"],
+                [self._python, str(self._mcp_main)],
                 cwd=os.getcwd(),
                 env=env,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',  # Forcer l'encodage UTF-8
-                errors='replace',  # Remplacer les caractères non décodables
-                bufsize=1,  # Line buffered
-                universal_newlines=True
+                start_new_session=True  # SIGINT du terminal géré par le lanceur seul
             )
             
+            # Drainer stdout/stderr en continu pour éviter le blocage du
+            # serveur une fois le tampon du tube rempli
+            if self.mcp_process.stdout:
+                self._start_pump(self.mcp_process.stdout, self._mcp_stdout_tail)
+            if self.mcp_process.stderr:
+                self._start_pump(self.mcp_process.stderr, self._mcp_stderr_tail)
+
             print(f"   ✅ Processus MCP lancé (PID: {self.mcp_process.pid})")
             print(f"   🌐 URL du serveur: {self.mcp_url}")
             return True
@@ -173,32 +325,32 @@ class RegulAILauncher:
         
         start_time = time.time()
         attempt = 0
-        
-        while time.time() - start_time < self.health_check_timeout:
-            attempt += 1
-            
-            try:
-                # Essayer de se connecter au serveur MCP
-                with httpx.Client(timeout=5.0) as client:
-                    # Essayer le endpoint /invoke qui est le point d'entrée principal du serveur MCP
-                    # selon l'architecture FastMCP streamable-http
+
+        # Client persistant pour toutes les tentatives : la connexion
+        # keep-alive est réutilisée au lieu de payer un handshake TCP par essai
+        probe_client = self._get_probe_client()
+
+        try:
+            while time.time() - start_time < self.health_check_timeout:
+                attempt += 1
+
+                try:
+                    # Sonder le endpoint /invoke avec un ping MCP : réponse de
+                    # quelques dizaines d'octets, contre plusieurs dizaines de
+                    # Ko pour un tools/list
                     try:
-                        # Envoyer une requête de "ping" via le protocole MCP
-                        payload = {
-                            "method": "tools/list",
-                            "params": {}
-                        }
-                        response = client.post(
+                        response = probe_client.post(
                             f"{self.mcp_url}/invoke",
-                            json=payload,
-                            headers={"Content-Type": "application/json"}
+                            content=_PING_BODY,
+                            headers=_JSON_HEADERS
                         )
-                        
-                        if response.status_code == 200:
-                            # Vérifier que la réponse est au format MCP attendu
+
+                        if response.status_code in (200, 202):
+                            # Toute réponse JSON sans erreur signifie que le
+                            # serveur traite les requêtes MCP
                             try:
                                 result = response.json()
-                                if "result" in result:
+                                if "error" not in result:
                                     print(f"   ✅ Serveur MCP opérationnel (tentative {attempt})")
                                     return True
                             except ValueError:
@@ -206,53 +358,60 @@ class RegulAILauncher:
                                 pass
                     except httpx.HTTPStatusError:
                         pass
-                    
-                    # Alternative: tester la connectivité de base sur l'endpoint racine
-                    try:
-                        response = client.get(f"{self.mcp_url}/")
-                        if response.status_code in [200, 404, 405]:  # Le serveur répond
-                            print(f"   ✅ Serveur MCP accessible (tentative {attempt})")
-                            return True
-                    except httpx.HTTPStatusError:
-                        pass
-                        
-            except httpx.RequestError as e:
-                # Serveur pas encore prêt
-                if attempt % 5 == 0:  # Afficher les erreurs seulement toutes les 5 tentatives
-                    print(f"   ⏳ Tentative {attempt}: {e}")
-            
-            except Exception as e:
-                print(f"   ⚠️  Erreur inattendue (tentative {attempt}): {e}")
-            
-            # Vérifier si le processus MCP est toujours vivant
-            if self.mcp_process and self.mcp_process.poll() is not None:
-                print("   ❌ Le processus MCP s'est arrêté de manière inattendue")
-                return_code = self.mcp_process.returncode
-                print(f"   📊 Code de sortie: {return_code}")
-                
-                # Lire les logs d'erreur et de sortie
-                try:
-                    if self.mcp_process.stderr:
-                        stderr_output = self.mcp_process.stderr.read()
-                        if stderr_output.strip():
-                            print(f"   📝 Erreurs MCP:")
-                            for line in stderr_output.strip().split('\n'):
-                                print(f"     {line}")
-                    
-                    if self.mcp_process.stdout:
-                        stdout_output = self.mcp_process.stdout.read()
-                        if stdout_output.strip():
-                            print(f"   📄 Sortie MCP:")
-                            for line in stdout_output.strip().split('\n'):
-                                print(f"     {line}")
+
+                    # Repli (une tentative sur cinq) : tolérer un serveur qui
+                    # rejette le ping via la connectivité de base, sans
+                    # attendre l'expiration du timeout complet
+                    if attempt % 5 == 0:
+                        try:
+                            response = probe_client.get(f"{self.mcp_url}/")
+                            if response.status_code in [200, 404, 405]:  # Le serveur répond
+                                print(f"   ✅ Serveur MCP accessible (tentative {attempt})")
+                                return True
+                        except httpx.HTTPStatusError:
+                            pass
+
+                except httpx.RequestError as e:
+                    # Serveur pas encore prêt
+                    if attempt % 5 == 0:  # Afficher les erreurs seulement toutes les 5 tentatives
+                        print(f"   ⏳ Tentative {attempt}: {e}")
+
                 except Exception as e:
-                    print(f"   ⚠️  Impossible de lire les logs: {e}")
-                return False
+                    print(f"   ⚠️  Erreur inattendue (tentative {attempt}): {e}")
+
+                # Vérifier si le processus MCP est toujours vivant
+                if self.mcp_process and self.mcp_process.poll() is not None:
+                    print("   ❌ Le processus MCP s'est arrêté de manière inattendue")
+                    return_code = self.mcp_process.returncode
+                    print(f"   📊 Code de sortie: {return_code}")
+                
+                    # Afficher les dernières lignes pompées (pas de read()
+                    # bloquant sur un tube potentiellement plein)
+                    if self._mcp_stderr_tail:
+                        print(f"   📝 Erreurs MCP:")
+                        for line in self._mcp_stderr_tail:
+                            print(f"     {line.decode('utf-8', errors='replace')}")
+
+                    if self._mcp_stdout_tail:
+                        print(f"   📄 Sortie MCP:")
+                        for line in self._mcp_stdout_tail:
+                            print(f"     {line.decode('utf-8', errors='replace')}")
+                    return False
             
-            time.sleep(self.health_check_interval)
+                # Attendre le prochain essai (backoff exponentiel avec jitter,
+                # plafonné à l'intervalle configuré), réveillé si le fils meurt :
+                # un serveur prêt en ~150 ms est détecté dès les essais rapides
+                delay = min(
+                    self.health_check_interval,
+                    0.02 * (2 ** min(attempt, 5)) + random.uniform(0, 0.05)
+                )
+                self._wait_or_child_exit(delay)
         
-        print(f"   ❌ Timeout après {self.health_check_timeout} secondes")
-        return False
+            print(f"   ❌ Timeout après {self.health_check_timeout} secondes")
+            return False
+
+        finally:
+            self._close_pidfd()
     
     def start_streamlit(self) -> bool:
         """
@@ -272,9 +431,9 @@ class RegulAILauncher:
             
             # Lancer Streamlit
             streamlit_cmd = [
-                self._get_python_executable(),
+                self._python,
                 "-m", "streamlit", "run",
-                "streamlit_app.py",
+                str(self._streamlit_app),
                 "--server.address", self.host,
                 "--server.port", str(self.streamlit_port),
                 "--server.headless", "true",
@@ -289,7 +448,8 @@ class RegulAILauncher:
                 stderr=subprocess.PIPE,
                 text=True,
                 encoding='utf-8',  # Forcer l'encodage UTF-8
-                errors='replace'   # Remplacer les caractères non décodables
+                errors='replace',  # Remplacer les caractères non décodables
+                start_new_session=True  # SIGINT du terminal géré par le lanceur seul
             )
             
             print(f"   ✅ Processus Streamlit lancé (PID: {self.streamlit_process.pid})")
@@ -349,18 +509,22 @@ class RegulAILauncher:
             
             # Attendre que les processus se terminent ou soient interrompus
             try:
-                while True:
-                    # Vérifier que les processus sont toujours vivants
-                    if self.mcp_process and self.mcp_process.poll() is not None:
-                        print("⚠️  Le serveur MCP s'est arrêté")
-                        break
-                    
-                    if self.streamlit_process and self.streamlit_process.poll() is not None:
-                        print("⚠️  L'application Streamlit s'est arrêtée")
-                        break
-                    
-                    time.sleep(1)
-                    
+                if hasattr(os, "pidfd_open"):
+                    # Attente bloquante sans réveil périodique (Linux)
+                    self._supervise_children()
+                else:
+                    while True:
+                        # Vérifier que les processus sont toujours vivants
+                        if self.mcp_process and self.mcp_process.poll() is not None:
+                            print("⚠️  Le serveur MCP s'est arrêté")
+                            break
+
+                        if self.streamlit_process and self.streamlit_process.poll() is not None:
+                            print("⚠️  L'application Streamlit s'est arrêtée")
+                            break
+
+                        time.sleep(1)
+
             except KeyboardInterrupt:
                 print("\n🛑 Arrêt demandé par l'utilisateur")
             
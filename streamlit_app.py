@@ -5,12 +5,22 @@ Cette application fournit une interface web pour interagir avec l'agent RegulAI,
 spécialisé dans la recherche juridique française.
 """
 
+import functools
 import streamlit as st
+import json
 import os
-import uuid
-import traceback
+import secrets
+import time
+from collections import deque
+from pathlib import Path
+from types import MappingProxyType
 from typing import Optional, Dict, Any, Generator
 
+# Nombre maximum de messages conservés dans l'historique : borne le coût de
+# re-rendu par interaction et la taille de session_state sur les très
+# longues sessions (les messages les plus anciens sont évincés)
+_MAX_HISTORY = 200
+
 # Configuration de la page
 st.set_page_config(
     page_title="RegulAI - Assistant Juridique",
@@ -25,7 +35,9 @@ st.set_page_config(
 
 def generate_thread_id() -> str:
     """Génère un identifiant unique pour la conversation."""
-    return f"streamlit-session-{uuid.uuid4().hex[:8]}"
+    # 4 octets d'aléa → 8 caractères hexadécimaux, même profil de collision
+    # que l'uuid4 tronqué utilisé auparavant, sans l'objet UUID intermédiaire
+    return f"streamlit-session-{secrets.token_hex(4)}"
 
 
 def get_api_key_from_sources() -> tuple[Optional[str], str]:
@@ -97,10 +109,38 @@ def validate_agent_configuration() -> tuple[bool, str]:
         return False, f"❌ Erreur de configuration : {str(e)}"
 
 
+# Versions mises en cache des vérifications d'état : la sidebar se re-rend à
+# chaque interaction (une par frappe dans le champ de clé API) et la sonde
+# MCP fait un aller-retour réseau — au plus une vraie vérification par 30 s
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_mcp_check() -> tuple[bool, str]:
+    """Variante de test_mcp_server_connection rafraîchie au plus toutes les 30 s."""
+    return test_mcp_server_connection()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_validate_config() -> tuple[bool, str]:
+    """Variante de validate_agent_configuration rafraîchie au plus toutes les 30 s."""
+    return validate_agent_configuration()
+
+
 # ============================================
 # INITIALISATION ET CACHE DE L'AGENT
 # ============================================
 
+@functools.lru_cache(maxsize=1)
+def _agent_module():
+    """
+    Importe le module agent une seule fois, au premier usage réel.
+
+    L'import de src.regulai.agent tire LangGraph et les schémas d'outils :
+    le différer permet à la page de s'afficher avant que l'agent ne soit
+    nécessaire, et le cache évite de repasser par la machinerie d'import.
+    """
+    import src.regulai.agent as agent_module
+    return agent_module
+
+
 @st.cache_resource
 def initialize_agent(google_api_key: str):
     """
@@ -116,10 +156,9 @@ def initialize_agent(google_api_key: str):
         # Configurer temporairement la clé API dans l'environnement
         os.environ["GOOGLE_API_KEY"] = google_api_key
         
-        # Import et création de l'agent
-        from src.regulai.agent import create_agent
-        agent = create_agent()
-        
+        # Import (mis en cache) et création de l'agent
+        agent = _agent_module().create_agent()
+
         return agent
     except ImportError as e:
         st.error(f"❌ Erreur d'import des modules RegulAI : {e}")
@@ -133,6 +172,58 @@ def initialize_agent(google_api_key: str):
 # TRAITEMENT DU STREAMING
 # ============================================
 
+# Libellés conviviaux des outils, construits une seule fois : le dictionnaire
+# était auparavant recréé à chaque appel d'outil dans la boucle de streaming
+_TOOL_DISPLAY_NAMES = MappingProxyType({
+    'search_legifrance': '🔍 Recherche sur Légifrance...',
+    'get_article': '📄 Récupération d\'article juridique...',
+    'browse_code': '📚 Navigation dans le code juridique...',
+    'batch_get_article': '📄 Récupération groupée d\'articles...',
+    'batch_search_legifrance': '🔍 Recherches groupées sur Légifrance...',
+})
+_TOOL_DEFAULT_TEMPLATE = '⚙️ Exécution de {}...'
+
+# Seuils de coalescence du streaming : un delta est poussé vers l'affichage
+# quand il atteint cette taille ou cet âge, selon la première échéance
+_FLUSH_MIN_CHARS = 64
+_FLUSH_MAX_DELAY = 0.08
+
+
+def coalesce_stream(deltas) -> Generator[str, None, None]:
+    """
+    Regroupe les petits deltas de streaming avant affichage.
+
+    Chaque fragment émis vers st.write_stream déclenche un re-rendu du
+    markdown accumulé côté frontend ; re-parser le tampon complet à chaque
+    token coûte O(n²) sur une longue réponse. Grouper les deltas par paquets
+    d'au moins _FLUSH_MIN_CHARS caractères ou _FLUSH_MAX_DELAY secondes
+    divise le nombre de re-rendus sans latence perceptible.
+
+    Args:
+        deltas: Générateur de fragments de texte
+
+    Yields:
+        str: Fragments regroupés
+    """
+    pending: list[str] = []
+    pending_size = 0
+    last_flush = time.monotonic()
+
+    for delta in deltas:
+        pending.append(delta)
+        pending_size += len(delta)
+
+        now = time.monotonic()
+        if pending_size >= _FLUSH_MIN_CHARS or now - last_flush >= _FLUSH_MAX_DELAY:
+            yield "".join(pending)
+            pending.clear()
+            pending_size = 0
+            last_flush = now
+
+    # Toujours vider le reliquat en fin (ou interruption) de flux
+    if pending:
+        yield "".join(pending)
+
 def process_streaming_events(stream_generator) -> Generator[str, None, None]:
     """
     Traite les événements de streaming de l'agent pour afficher les étapes intermédiaires.
@@ -148,68 +239,104 @@ def process_streaming_events(stream_generator) -> Generator[str, None, None]:
     - Permettre l'affichage des étapes intermédiaires de l'agent
     - Maintenir la compatibilité avec st.write_stream
     """
-    active_statuses = {}  # Pour traquer les statuses actifs par outil
-    last_content = ""  # Pour éviter la duplication de contenu
-    
+    # Un unique conteneur st.status partagé par tous les appels d'outils du
+    # tour : un seul élément frontend à réconcilier au lieu d'un par outil
+    tool_status = None
+    pending_tools = {}  # tool_call_id -> libellé, appels en attente de réponse
+    # Le contenu streamé par l'agent ne fait que croître : mémoriser la
+    # longueur déjà émise suffit et évite de comparer des chaînes de plus
+    # en plus longues à chaque événement (coût quadratique sur la réponse)
+    last_len = 0
+    last_fallback_hash = None  # Déduplication du chemin de repli (texte brut)
+
     try:
         for event in stream_generator:
-            # Les événements en mode "updates" sont des dictionnaires avec des clés de nœuds
-            if isinstance(event, dict):
-                # Parcourir chaque nœud dans l'événement
-                for node_name, node_data in event.items():
-                    # Vérifier s'il y a des messages dans les données du nœud
-                    if isinstance(node_data, dict) and "messages" in node_data:
-                        messages = node_data["messages"]
-                        if messages:
-                            last_message = messages[-1]
-                            
-                            # Détecter les appels d'outils dans les messages AI (nœud "agent")
-                            if node_name == "agent" and hasattr(last_message, 'tool_calls') and last_message.tool_calls:
-                                for tool_call in last_message.tool_calls:
-                                    tool_name = tool_call.get('name', 'outil_inconnu')
-                                    tool_id = tool_call.get('id', f'tool_{len(active_statuses)}')
-                                    
-                                    # Mapper les noms d'outils vers des messages plus conviviaux
-                                    tool_display_names = {
-                                        'search_legifrance': '🔍 Recherche sur Légifrance...',
-                                        'get_article': '📄 Récupération d\'article juridique...',
-                                        'browse_code': '📚 Navigation dans le code juridique...',
-                                    }
-                                    
-                                    status_message = tool_display_names.get(tool_name, f'⚙️ Exécution de {tool_name}...')
-                                    
-                                    # Créer un indicateur de statut pour cet outil
-                                    if tool_id not in active_statuses:
-                                        active_statuses[tool_id] = st.status(status_message, expanded=False)
-                            
-                            # Détecter les réponses d'outils (nœud "tools")
-                            elif node_name == "tools" and hasattr(last_message, 'tool_call_id'):
-                                tool_call_id = last_message.tool_call_id
-                                # Fermer le statut correspondant s'il existe
-                                if tool_call_id in active_statuses:
-                                    status = active_statuses[tool_call_id]
-                                    status.update(label="✅ Terminé", state="complete")
-                                    # Retirer de la liste des statuses actifs
-                                    del active_statuses[tool_call_id]
-                            
-                            # Si c'est un message de réponse finale de l'agent (sans appels d'outils)
-                            elif (node_name == "agent" and 
-                                  hasattr(last_message, 'content') and 
-                                  last_message.content and
-                                  not (hasattr(last_message, 'tool_calls') and last_message.tool_calls)):
-                                
-                                # Yielder seulement le nouveau contenu pour éviter la duplication
-                                current_content = last_message.content
-                                if current_content != last_content:
-                                    # Yield le contenu complet (st.write_stream gère l'affichage progressif)
-                                    yield current_content
-                                    last_content = current_content
-            else:
+            # Les événements en mode "updates" sont des dictionnaires avec des
+            # clés de nœuds. Le schéma étant stable, on déballe en style EAFP
+            # plutôt que d'empiler isinstance/hasattr à chaque événement
+            try:
+                node_items = event.items()
+            except AttributeError:
                 # Si ce n'est pas un événement structuré attendu, essayer de le traiter comme du texte
-                content_str = str(event) if event else ""
-                if content_str and content_str.strip() and content_str != last_content:
-                    yield content_str
-                    last_content = content_str
+                if isinstance(event, str):
+                    content_str = event
+                else:
+                    content_str = str(event) if event else ""
+                # isspace() teste le contenu sans allouer de chaîne comme strip()
+                if content_str and not content_str.isspace():
+                    # Un hash suffit pour dédupliquer sans garder la chaîne
+                    content_hash = hash(content_str)
+                    if content_hash != last_fallback_hash:
+                        yield content_str
+                        last_fallback_hash = content_hash
+                continue
+
+            # Parcourir chaque nœud dans l'événement
+            for node_name, node_data in node_items:
+                # Récupérer les messages du nœud (absents ou vides : ignorer)
+                try:
+                    messages = node_data["messages"]
+                except (TypeError, KeyError):
+                    continue
+                if not messages:
+                    continue
+
+                last_message = messages[-1]
+                tool_calls = getattr(last_message, 'tool_calls', None)
+
+                # Détecter les appels d'outils dans les messages AI (nœud "agent")
+                if node_name == "agent" and tool_calls:
+                    for tool_call in tool_calls:
+                        tool_name = tool_call.get('name', 'outil_inconnu')
+                        tool_id = tool_call.get('id', f'tool_{len(pending_tools)}')
+
+                        if tool_id in pending_tools:
+                            continue
+
+                        # Mapper les noms d'outils vers des messages plus
+                        # conviviaux (repli formaté seulement si nécessaire)
+                        status_message = (
+                            _TOOL_DISPLAY_NAMES.get(tool_name)
+                            or _TOOL_DEFAULT_TEMPLATE.format(tool_name)
+                        )
+                        pending_tools[tool_id] = status_message
+
+                        # Créer le conteneur au premier outil, le réétiqueter ensuite
+                        if tool_status is None:
+                            tool_status = st.status(status_message, expanded=False)
+                        else:
+                            tool_status.update(label=status_message, state="running")
+
+                # Détecter les réponses d'outils (nœud "tools"). L'update peut
+                # contenir plusieurs ToolMessage et, quand call_tools
+                # court-circuite sur des observations déjà vues, se terminer
+                # par un AIMessage de conclusion : parcourir tous les messages
+                # pour clôturer chaque statut ET émettre cette conclusion
+                # (ne regarder que messages[-1] la faisait disparaître)
+                elif node_name == "tools":
+                    for message in messages:
+                        tool_call_id = getattr(message, 'tool_call_id', None)
+                        if tool_call_id is not None:
+                            finished = pending_tools.pop(tool_call_id, None)
+                            if finished is not None and tool_status is not None:
+                                # Consigner l'outil terminé dans le conteneur partagé
+                                tool_status.write(f"✅ {finished}")
+                                if not pending_tools:
+                                    tool_status.update(label="✅ Terminé", state="complete")
+                        else:
+                            # AIMessage final synthétisé par le court-circuit
+                            conclusion = getattr(message, 'content', None)
+                            if conclusion and len(conclusion) > last_len:
+                                yield conclusion[last_len:]
+                                last_len = len(conclusion)
+
+                # Si c'est un message de réponse finale de l'agent (sans appels d'outils)
+                elif node_name == "agent":
+                    current_content = getattr(last_message, 'content', None)
+                    if current_content and len(current_content) > last_len:
+                        # Yielder seulement le delta non encore émis
+                        yield current_content[last_len:]
+                        last_len = len(current_content)
     
     except Exception as e:
         yield f"❌ Erreur lors du traitement du streaming : {str(e)}"
@@ -231,31 +358,38 @@ def handle_user_message(prompt: str, agent) -> Optional[str]:
         Réponse de l'agent ou None en cas d'erreur
     """
     try:
-        # Import de la fonction de streaming
-        from src.regulai.agent import stream_agent_conversation
-        
         # Créer le générateur de streaming pour l'agent RegulAI avec détection d'outils
-        raw_stream_generator = stream_agent_conversation(
+        raw_stream_generator = _agent_module().stream_agent_conversation(
             message=prompt,
             thread_id=st.session_state.thread_id,
             agent=agent
         )
         
-        # Traiter les événements pour afficher les statuts d'outils
-        processed_stream = process_streaming_events(raw_stream_generator)
-        
-        # Utiliser st.write_stream pour afficher la réponse en temps réel
-        # st.write_stream consomme le générateur et retourne le contenu complet
-        response_content = st.write_stream(processed_stream)
-        
-        # S'assurer que le retour est toujours une chaîne
-        if isinstance(response_content, list):
-            return "\n".join(str(item) for item in response_content)
-        elif response_content is not None:
-            return str(response_content)
-        else:
-            return None
-        
+        # Traiter les événements pour afficher les statuts d'outils,
+        # puis regrouper les deltas pour limiter les re-rendus frontend
+        processed_stream = coalesce_stream(process_streaming_events(raw_stream_generator))
+
+        # Rendu rapide pendant le flux : texte brut (pas de parse markdown
+        # par delta), puis un unique rendu markdown une fois le flux terminé.
+        # Un seul parse du contenu complet au lieu d'un par paquet émis.
+        # L'état du flux est publié en session pour que les actions de la
+        # sidebar sachent qu'une réponse est en cours ; le finally garantit
+        # le retour à "idle" même si le rerun interrompt le script.
+        placeholder = st.empty()
+        accumulated = ""
+        st.session_state._stream_state = "streaming"
+        try:
+            for chunk in processed_stream:
+                accumulated += chunk
+                placeholder.text(accumulated)
+        finally:
+            st.session_state._stream_state = "idle"
+
+        if accumulated:
+            placeholder.markdown(accumulated)
+            return accumulated
+        return None
+
     except ImportError as e:
         st.error(f"❌ Erreur d'import : {e}")
         return None
@@ -265,11 +399,42 @@ def handle_user_message(prompt: str, agent) -> Optional[str]:
         return None
 
 
+def _spill_message(message: Dict[str, Any]) -> None:
+    """
+    Déverse un message évincé de l'historique vers un fichier de session.
+
+    Le déversement est best-effort : un disque en lecture seule ne doit pas
+    faire échouer la conversation.
+    """
+    try:
+        spill_dir = Path(".streamlit")
+        spill_dir.mkdir(exist_ok=True)
+        spill_path = spill_dir / f"chat_{st.session_state.thread_id}.jsonl"
+        with spill_path.open("a", encoding="utf-8") as fh:
+            fh.write(json.dumps(message, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+
+
+def append_message(message: Dict[str, Any]) -> None:
+    """
+    Ajoute un message à l'historique borné.
+
+    Quand la deque est pleine, le message le plus ancien est déversé sur
+    disque avant d'être évincé, pour que l'historique complet reste
+    consultable hors application.
+    """
+    messages = st.session_state.messages
+    if len(messages) == _MAX_HISTORY:
+        _spill_message(messages[0])
+    messages.append(message)
+
+
 def reset_conversation():
     """Réinitialise complètement la conversation."""
     if "messages" in st.session_state:
-        st.session_state.messages = []
-    
+        st.session_state.messages = deque(maxlen=_MAX_HISTORY)
+
     # Générer un nouveau thread_id pour une nouvelle conversation
     st.session_state.thread_id = generate_thread_id()
     
@@ -278,24 +443,21 @@ def reset_conversation():
         "role": "assistant", 
         "content": "Bonjour ! Je suis RegulAI, votre assistant juridique spécialisé dans le droit français. Comment puis-je vous aider aujourd'hui ?"
     }
-    st.session_state.messages.append(welcome_message)
+    append_message(welcome_message)
 
 
 # ============================================
 # COMPOSANTS DE L'INTERFACE
 # ============================================
 
-def render_welcome_section():
-    """Affiche la section de bienvenue."""
-    st.title("⚖️ RegulAI - Assistant Juridique")
-    st.subheader("🤖 Votre assistant IA spécialisé en recherche juridique française")
-    
-    st.markdown("""
+# Blocs markdown statiques de l'interface, définis une seule fois au
+# chargement du module plutôt que comme littéraux dans les fonctions de rendu
+_WELCOME_MD = """
     ---
     ### Bienvenue sur RegulAI !
 
-    RegulAI est un assistant IA intelligent spécialisé dans la recherche juridique française. 
-    Il utilise l'architecture LangGraph et des outils MCP pour vous fournir des réponses précises 
+    RegulAI est un assistant IA intelligent spécialisé dans la recherche juridique française.
+    Il utilise l'architecture LangGraph et des outils MCP pour vous fournir des réponses précises
     et actualisées sur le droit français.
 
     **Fonctionnalités principales :**
@@ -305,20 +467,56 @@ def render_welcome_section():
     - 💬 Interface conversationnelle intuitive
 
     ---
-    """)
+    """
+
+_CONFIG_WARNING_MD = """
+    ⚠️ **Configuration requise**
+
+    Pour utiliser RegulAI, vous devez configurer votre clé API Google.
+
+    **Options de configuration :**
+
+    1. **Via la barre latérale** ← Saisissez votre clé dans le champ à gauche
+    2. **Via un fichier secrets.toml** ← Créez `.streamlit/secrets.toml` :
+       ```toml
+       GOOGLE_API_KEY = "AI-votre-clé-ici"
+       ```
+    3. **Via les variables d'environnement** ← Définissez `GOOGLE_API_KEY`
 
+    [🔗 Obtenir une clé API Google](https://aistudio.google.com/app/apikey)
+    """
+
+
+def render_welcome_section():
+    """Affiche la section de bienvenue."""
+    st.title("⚖️ RegulAI - Assistant Juridique")
+    st.subheader("🤖 Votre assistant IA spécialisé en recherche juridique française")
 
+    st.markdown(_WELCOME_MD)
+
+
+@st.fragment
 def render_api_key_configuration():
     """
     Gère la configuration de la clé API Google dans la sidebar.
-    
-    Returns:
-        bool: True si la clé API est configurée, False sinon
+
+    Déclarée comme fragment : chaque frappe dans le champ de saisie ne
+    relance que cette fonction, pas la page entière (sondes d'état et
+    rejeu de l'historique compris). Un rerun global n'est demandé que
+    lorsque la clé passe de absente à présente (ou inversement), pour que
+    le panneau principal bascule entre avertissement et chat.
+
+    Les fragments ne peuvent pas retourner de valeur : l'état « clé
+    configurée » est publié dans st.session_state._api_key_configured.
     """
     st.subheader("🔑 Clé API Google")
-    
-    # Vérifier les sources existantes
-    api_key_from_sources, source = get_api_key_from_sources()
+
+    # Vérifier les sources existantes, une fois par session : st.secrets
+    # relit secrets.toml et cette fonction tourne à chaque frappe dans le
+    # champ de saisie (chaque frappe déclenche un rerun complet)
+    if "_api_src" not in st.session_state:
+        st.session_state._api_src = get_api_key_from_sources()
+    api_key_from_sources, source = st.session_state._api_src
     
     # Initialiser la session state pour la clé API
     if "google_api_key" not in st.session_state:
@@ -338,7 +536,15 @@ def render_api_key_configuration():
     # Mettre à jour la session state si l'utilisateur a saisi une clé
     if user_api_key and source == "non trouvée":
         st.session_state.google_api_key = user_api_key
-    
+
+    # Demander un rerun global uniquement sur le front montant/descendant
+    # de « clé configurée » : c'est le seul cas où le reste de la page change
+    configured = bool(st.session_state.google_api_key)
+    previous = st.session_state.get("_api_key_configured")
+    st.session_state._api_key_configured = configured
+    if previous is not None and configured != previous:
+        st.rerun(scope="app")
+
     # Affichage du statut de la clé API
     if st.session_state.google_api_key:
         if source != "non trouvée":
@@ -346,34 +552,32 @@ def render_api_key_configuration():
         else:
             st.success("✅ Clé API saisie par l'utilisateur")
         
-        # Masquer la clé (afficher seulement les premiers et derniers caractères)
-        masked_key = mask_api_key(st.session_state.google_api_key)
-        st.caption(f"🔒 Clé active : `{masked_key}`")
-        
-        return True
+        # Masquer la clé (afficher seulement les premiers et derniers
+        # caractères), en mémorisant le résultat tant que la clé ne change pas
+        current_key = st.session_state.google_api_key
+        memo = st.session_state.get("_masked_key")
+        if memo is None or memo[0] != current_key:
+            memo = (current_key, mask_api_key(current_key))
+            st.session_state._masked_key = memo
+        st.caption(f"🔒 Clé active : `{memo[1]}`")
     else:
         st.error("❌ Aucune clé API configurée")
-        return False
 
 
 def render_system_status():
     """Affiche l'état du système dans la sidebar."""
     st.header("📋 État du système")
     
-    # Vérifier la configuration
-    config_valid, config_msg = validate_agent_configuration()
-    
-    # Vérifier la connexion MCP
-    mcp_connected, mcp_msg = test_mcp_server_connection()
+    # Vérifier la configuration (résultat mis en cache 30 s)
+    config_valid, config_msg = _cached_validate_config()
+
+    # Vérifier la connexion MCP (résultat mis en cache 30 s)
+    mcp_connected, mcp_msg = _cached_mcp_check()
     
-    # État de l'agent
-    agent_status = "❌ Non initialisé"
-    if st.session_state.get("google_api_key"):
-        try:
-            agent = initialize_agent(st.session_state.google_api_key)
-            agent_status = "✅ Opérationnel" if agent else "❌ Erreur d'initialisation"
-        except:
-            agent_status = "❌ Erreur d'initialisation"
+    # État de l'agent : lu depuis la session, positionné par l'interface de
+    # chat après la première initialisation — pas d'appel à initialize_agent
+    # ici juste pour produire un libellé
+    agent_status = st.session_state.get("_agent_status", "❓ Non vérifié")
     
     st.markdown(f"""
     **Version :** 0.2.0
@@ -390,6 +594,12 @@ def render_system_status():
     - 🔑 [Obtenir une clé API Google](https://aistudio.google.com/app/apikey)
     """)
 
+    # Forcer une re-vérification immédiate sans attendre l'expiration du TTL
+    if st.button("🔄 Rafraîchir l'état", help="Relancer les vérifications d'état"):
+        _cached_validate_config.clear()
+        _cached_mcp_check.clear()
+        st.rerun()
+
 
 def render_conversation_actions():
     """Affiche les actions de conversation dans la sidebar."""
@@ -397,26 +607,43 @@ def render_conversation_actions():
         return
     
     st.subheader("💬 Actions")
-    
+
+    # Ne pas réinitialiser quoi que ce soit pendant qu'une réponse streame
+    streaming = st.session_state.get("_stream_state") == "streaming"
+
     col1, col2 = st.columns(2)
-    
+
     # Bouton pour nouvelle conversation
     with col1:
         if st.button("🆕 Nouvelle", help="Démarrer une nouvelle conversation", type="primary"):
-            reset_conversation()
-            st.rerun()
+            if streaming:
+                st.toast("⏳ Réponse en cours, réessayez dans un instant")
+            else:
+                # Pas de st.rerun() : le clic du bouton a déjà déclenché un
+                # run complet, et l'interface de chat se rend après la
+                # sidebar — elle verra la conversation réinitialisée dans ce
+                # même run (un seul passage au lieu de deux)
+                reset_conversation()
     
     # Bouton pour réinitialiser l'agent
     with col2:
         if st.button("🔄 Reset Agent", help="Réinitialiser l'agent en cas de problème", type="secondary"):
-            # Vider le cache de l'agent pour le forcer à se réinitialiser
-            initialize_agent.clear()
-            st.rerun()
-    
-    # Afficher les informations de session
+            if streaming:
+                st.toast("⏳ Réponse en cours, réessayez dans un instant")
+            else:
+                # Vider le cache de l'agent pour le forcer à se réinitialiser,
+                # ainsi que les mémos de session liés à la clé API. Le run en
+                # cours (déclenché par le clic) suffit : l'état système se
+                # rend après ce bloc et reflète déjà les caches vidés
+                initialize_agent.clear()
+                st.session_state.pop("_api_src", None)
+                st.session_state.pop("_masked_key", None)
+                st.session_state.pop("_agent_status", None)
+    
+    # Afficher les informations de session (historique borné à _MAX_HISTORY)
     if "messages" in st.session_state:
         msg_count = len(st.session_state.messages)
-        st.caption(f"📝 Messages : {msg_count}")
+        st.caption(f"📝 Messages : {msg_count}/{_MAX_HISTORY}")
     
     if "thread_id" in st.session_state:
         st.caption(f"🔗 Session : `{st.session_state.thread_id}`")
@@ -425,21 +652,29 @@ def render_conversation_actions():
     st.caption("💬 Mode streaming activé")
 
 
+@st.fragment
 def render_chat_interface():
-    """Affiche l'interface de chat principale."""
+    """
+    Affiche l'interface de chat principale.
+
+    Déclarée comme fragment : une soumission dans st.chat_input ne relance
+    que cette fonction, et inversement les interactions de la sidebar ne
+    re-déroulent pas l'historique complet de la conversation.
+    """
     # Initialiser l'identifiant de conversation unique
     if "thread_id" not in st.session_state:
         st.session_state.thread_id = generate_thread_id()
     
     # Initialiser l'historique de conversation dans session_state
+    # (deque bornée : l'historique ne croît pas indéfiniment)
     if "messages" not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = deque(maxlen=_MAX_HISTORY)
         # Message de bienvenue
         welcome_message = {
             "role": "assistant", 
             "content": "Bonjour ! Je suis RegulAI, votre assistant juridique spécialisé dans le droit français. Comment puis-je vous aider aujourd'hui ?"
         }
-        st.session_state.messages.append(welcome_message)
+        append_message(welcome_message)
     
     # Afficher l'historique des messages
     for message in st.session_state.messages:
@@ -450,7 +685,7 @@ def render_chat_interface():
     if prompt := st.chat_input("Posez votre question juridique..."):
         # Ajouter le message utilisateur à l'historique
         user_message = {"role": "user", "content": prompt}
-        st.session_state.messages.append(user_message)
+        append_message(user_message)
         
         # Afficher le message utilisateur
         with st.chat_message("user"):
@@ -459,7 +694,12 @@ def render_chat_interface():
         # Obtenir l'agent initialisé
         try:
             agent = initialize_agent(st.session_state.google_api_key)
-            
+
+            # Mémoriser l'état pour le panneau latéral (render_system_status)
+            st.session_state._agent_status = (
+                "✅ Opérationnel" if agent else "❌ Erreur d'initialisation"
+            )
+
             if agent:
                 # Afficher la réponse de l'agent avec streaming et statut des outils
                 with st.chat_message("assistant"):
@@ -468,13 +708,13 @@ def render_chat_interface():
                     if response_content:
                         # Ajouter la réponse à l'historique
                         assistant_message = {"role": "assistant", "content": response_content}
-                        st.session_state.messages.append(assistant_message)
+                        append_message(assistant_message)
                     else:
                         # En cas d'erreur, ajouter un message d'erreur générique
                         error_msg = "❌ Impossible de traiter votre demande. Veuillez réessayer."
                         st.markdown(error_msg)
                         assistant_message = {"role": "assistant", "content": error_msg}
-                        st.session_state.messages.append(assistant_message)
+                        append_message(assistant_message)
             else:
                 # Agent non initialisé - afficher un message d'erreur
                 error_msg = "❌ **Agent non disponible**\n\nL'agent RegulAI n'a pas pu être initialisé. Vérifiez votre clé API Google."
@@ -483,37 +723,23 @@ def render_chat_interface():
                     st.markdown(error_msg)
                 
                 assistant_message = {"role": "assistant", "content": error_msg}
-                st.session_state.messages.append(assistant_message)
+                append_message(assistant_message)
                 
         except Exception as e:
             # Erreur générale d'initialisation
+            st.session_state._agent_status = "❌ Erreur d'initialisation"
             error_msg = f"❌ **Erreur système**\n\n{str(e)}"
             
             with st.chat_message("assistant"):
                 st.markdown(error_msg)
             
             assistant_message = {"role": "assistant", "content": error_msg}
-            st.session_state.messages.append(assistant_message)
+            append_message(assistant_message)
 
 
 def render_configuration_warning():
     """Affiche les instructions de configuration si nécessaire."""
-    st.warning("""
-    ⚠️ **Configuration requise**
-    
-    Pour utiliser RegulAI, vous devez configurer votre clé API Google. 
-    
-    **Options de configuration :**
-    
-    1. **Via la barre latérale** ← Saisissez votre clé dans le champ à gauche
-    2. **Via un fichier secrets.toml** ← Créez `.streamlit/secrets.toml` :
-       ```toml
-       GOOGLE_API_KEY = "AI-votre-clé-ici"
-       ```
-    3. **Via les variables d'environnement** ← Définissez `GOOGLE_API_KEY`
-    
-    [🔗 Obtenir une clé API Google](https://aistudio.google.com/app/apikey)
-    """)
+    st.warning(_CONFIG_WARNING_MD)
     
     st.info("💡 **Votre clé API est sécurisée** - Elle est stockée uniquement dans votre session et jamais transmise ailleurs que vers l'API Google.")
 
@@ -525,15 +751,22 @@ def render_configuration_warning():
 def main():
     """Fonction principale de l'application."""
     try:
-        # Afficher la section de bienvenue
-        render_welcome_section()
+        # Afficher la section de bienvenue uniquement sur la vue d'accueil
+        # (au plus le message de bienvenue) : en pleine conversation, ce
+        # bloc markdown serait re-rendu à chaque run pour rester hors écran
+        if len(st.session_state.get("messages", ())) <= 1:
+            render_welcome_section()
+        else:
+            st.title("⚖️ RegulAI - Assistant Juridique")
         
         # Sidebar - Configuration et état
         with st.sidebar:
             st.header("🔧 Configuration")
             
-            # Configuration de la clé API
-            api_key_configured = render_api_key_configuration()
+            # Configuration de la clé API (fragment : publie son état via
+            # st.session_state plutôt que par valeur de retour)
+            render_api_key_configuration()
+            api_key_configured = st.session_state.get("_api_key_configured", False)
             
             st.divider()
             
@@ -556,8 +789,10 @@ def main():
         st.error(f"❌ **Erreur critique de l'application**")
         st.error(f"Détails : {str(e)}")
         
-        # Afficher la stack trace en mode développement
+        # Afficher la stack trace en mode développement (import et formatage
+        # uniquement si la case est cochée : le parcours de pile est coûteux)
         if st.checkbox("🔧 Afficher les détails techniques", help="Pour le debugging"):
+            import traceback
             st.code(traceback.format_exc())
         
         st.info("💡 Essayez de recharger la page ou contactez le support si le problème persiste.")
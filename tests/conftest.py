@@ -4,6 +4,7 @@ Configuration pytest pour les tests RegulAI.
 Ce fichier contient les fixtures communes et la configuration de test.
 """
 
+import logging
 import pytest
 import os
 import sys
@@ -15,7 +16,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from regulai.config import RegulAIConfig
 
 
-@pytest.fixture
+# Les fixtures sont partagées à l'échelle de la session : la configuration
+# est gelée (frozen) et les mocks sont remis à zéro entre les tests par la
+# fixture autouse ci-dessous, donc une seule construction suffit
+@pytest.fixture(scope="session")
 def mock_config():
     """Fixture qui fournit une configuration mockée pour les tests."""
     config = RegulAIConfig(
@@ -31,7 +35,7 @@ def mock_config():
     return config
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_mcp_client():
     """Fixture qui fournit un client MCP mocké."""
     client = Mock()
@@ -41,10 +45,49 @@ def mock_mcp_client():
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_google_response():
     """Fixture qui fournit une réponse Google Gemini mockée."""
     response = Mock()
     response.content = "Réponse de test de l'agent"
     response.tool_calls = []
-    return response 
\ No newline at end of file
+    return response
+
+
+@pytest.fixture(scope="session")
+def mcp_client():
+    """
+    Client MCP réel (non mocké), partagé entre les tests purs.
+
+    Le constructeur est paresseux (aucune connexion HTTP n'est ouverte tant
+    qu'un appel n'est pas fait), donc l'instance est sûre à partager pour
+    les tests qui n'exercent que le parsing.
+    """
+    from regulai.tools import MCPClient
+    return MCPClient()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _quiet_logging():
+    """
+    Désactive le logging pendant la session de test.
+
+    Évite l'interpolation des chaînes de format et les E/S des handlers
+    pour chaque appel de log des modules importés.
+    """
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks(mock_mcp_client, mock_google_response):
+    """
+    Remet à zéro l'historique des mocks partagés avant chaque test.
+
+    reset_mock() efface les appels enregistrés mais conserve les valeurs de
+    retour configurées, ce qui préserve l'isolation des tests tout en
+    réutilisant les objets de session.
+    """
+    mock_mcp_client.reset_mock()
+    mock_google_response.reset_mock() 
\ No newline at end of file
@@ -0,0 +1,57 @@
+"""
+Tests pour le checkpointing compressé de RegulAI.
+
+Ce module teste le sérialiseur compressé et le checkpointer associé.
+"""
+
+import os
+import sys
+
+# Ajouter le répertoire src au PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from regulai.checkpoint import (
+    CompressedSerializer,
+    create_compressed_checkpointer,
+    _COMPRESSED_PREFIX,
+)
+
+
+def test_small_payload_not_compressed():
+    """Test qu'une petite charge est stockée sans compression."""
+    serde = CompressedSerializer()
+
+    obj = {"messages": ["court"]}
+    type_, data = serde.dumps_typed(obj)
+
+    assert not type_.startswith(_COMPRESSED_PREFIX)
+    assert serde.loads_typed((type_, data)) == obj
+
+
+def test_large_payload_roundtrip():
+    """Test qu'une charge volumineuse est compressée puis restituée à l'identique."""
+    serde = CompressedSerializer()
+
+    obj = {"messages": ["contenu répétitif des congés payés " * 100]}
+    type_, data = serde.dumps_typed(obj)
+
+    assert type_.startswith(_COMPRESSED_PREFIX)
+    assert serde.loads_typed((type_, data)) == obj
+
+
+def test_compression_reduces_size():
+    """Test que la compression réduit effectivement la taille stockée."""
+    plain = CompressedSerializer.__mro__[1]()  # JsonPlusSerializer
+    serde = CompressedSerializer()
+
+    obj = {"messages": ["texte juridique très redondant " * 200]}
+    _, plain_data = plain.dumps_typed(obj)
+    _, compressed_data = serde.dumps_typed(obj)
+
+    assert len(compressed_data) < len(plain_data)
+
+
+def test_create_compressed_checkpointer():
+    """Test que le checkpointer utilise bien le sérialiseur compressé."""
+    checkpointer = create_compressed_checkpointer()
+    assert isinstance(checkpointer.serde, CompressedSerializer)
@@ -0,0 +1,92 @@
+"""
+Tests pour les nœuds du graphe RegulAI.
+
+Ce module teste l'exécution des outils par le nœud call_tools.
+"""
+
+import os
+import sys
+from unittest.mock import Mock, patch
+
+# Ajouter le répertoire src au PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from regulai.graph import call_tools, route_after_tools, should_continue
+
+
+def _ai_message_with_tool_calls(tool_calls):
+    """Construit un AIMessage avec les appels d'outils donnés."""
+    return AIMessage(content="", tool_calls=tool_calls)
+
+
+def test_call_tools_deduplicates_identical_calls():
+    """Test que les appels identiques d'un même tour ne sont exécutés qu'une fois."""
+    mock_tool = Mock()
+    mock_tool.invoke.return_value = "Résultat partagé"
+
+    message = _ai_message_with_tool_calls([
+        {"name": "search_legifrance", "args": {"query": "congés payés"}, "id": "call-1"},
+        {"name": "search_legifrance", "args": {"query": "congés payés"}, "id": "call-2"},
+    ])
+
+    with patch('regulai.graph.get_tools_dict', return_value={"search_legifrance": mock_tool}):
+        result = call_tools({"messages": [message]})
+
+    tool_messages = result["messages"]
+    assert len(tool_messages) == 2
+    assert [m.tool_call_id for m in tool_messages] == ["call-1", "call-2"]
+    assert all(m.content == "Résultat partagé" for m in tool_messages)
+    # Un seul appel réel malgré deux tool_calls identiques
+    assert mock_tool.invoke.call_count == 1
+
+
+def test_call_tools_unknown_tool():
+    """Test qu'un outil inconnu produit un message d'erreur."""
+    message = _ai_message_with_tool_calls([
+        {"name": "outil_inexistant", "args": {}, "id": "call-1"},
+    ])
+
+    with patch('regulai.graph.get_tools_dict', return_value={}):
+        result = call_tools({"messages": [message]})
+
+    assert len(result["messages"]) == 1
+    assert "non disponible" in result["messages"][0].content
+
+
+def test_call_tools_short_circuits_on_stale_observations():
+    """Test qu'un tour sans information nouvelle conclut sans repasser par le LLM."""
+    mock_tool = Mock()
+    mock_tool.invoke.return_value = "Résultat déjà vu"
+
+    previous_observation = ToolMessage(content="Résultat déjà vu", tool_call_id="call-0")
+    message = _ai_message_with_tool_calls([
+        {"name": "search_legifrance", "args": {"query": "congés payés"}, "id": "call-1"},
+    ])
+    state = {"messages": [previous_observation, message]}
+
+    with patch('regulai.graph.get_tools_dict', return_value={"search_legifrance": mock_tool}):
+        result = call_tools(state)
+
+    # Le tour se termine par un AIMessage synthétisé
+    assert isinstance(result["messages"][-1], AIMessage)
+    assert "aucune information nouvelle" in result["messages"][-1].content
+
+    # Et le routage après outils court-circuite le modèle
+    assert route_after_tools({"messages": result["messages"]}) == "__end__"
+    assert route_after_tools({"messages": [previous_observation]}) == "agent"
+
+
+def test_should_continue():
+    """Test la décision de continuer vers les outils ou de terminer."""
+    with_tools = _ai_message_with_tool_calls([
+        {"name": "search_legifrance", "args": {"query": "test"}, "id": "call-1"},
+    ])
+    assert should_continue({"messages": [with_tools]}) == "tools"
+
+    without_tools = AIMessage(content="Réponse finale")
+    assert should_continue({"messages": [without_tools]}) == "__end__"
+
+    human = HumanMessage(content="Question")
+    assert should_continue({"messages": [human]}) == "__end__"
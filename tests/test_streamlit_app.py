@@ -0,0 +1,88 @@
+"""
+Tests du consommateur de streaming de l'application Streamlit.
+
+Ce module vérifie le traitement des événements LangGraph (mode "updates")
+par process_streaming_events, notamment la forme d'événement produite par
+le court-circuit de call_tools : des ToolMessage suivis d'un AIMessage de
+conclusion dans le même update "tools".
+"""
+
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+# streamlit_app.py vit à la racine du dépôt (conftest.py n'ajoute que src)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+pytest.importorskip("streamlit")
+
+from streamlit_app import process_streaming_events
+
+
+class _FakeAIMessage:
+    """AIMessage minimal : contenu et appels d'outils éventuels."""
+
+    def __init__(self, content="", tool_calls=None):
+        self.content = content
+        self.tool_calls = tool_calls or []
+
+
+class _FakeToolMessage:
+    """ToolMessage minimal : contenu et identifiant d'appel d'outil."""
+
+    def __init__(self, content, tool_call_id):
+        self.content = content
+        self.tool_call_id = tool_call_id
+
+
+def test_short_circuit_conclusion_is_streamed():
+    """
+    La conclusion synthétisée par call_tools doit atteindre l'utilisateur.
+
+    Quand toutes les observations d'un tour sont déjà connues, call_tools
+    termine l'update "tools" par un AIMessage de conclusion : le
+    consommateur doit clôturer les statuts des ToolMessage ET émettre ce
+    contenu, au lieu d'ignorer l'événement parce que son dernier message
+    n'a pas de tool_call_id.
+    """
+    conclusion = (
+        "Les outils n'ont retourné aucune information nouvelle par "
+        "rapport aux résultats déjà obtenus dans cette conversation."
+    )
+    events = [
+        {"agent": {"messages": [_FakeAIMessage(tool_calls=[
+            {"name": "get_article", "id": "call_1", "args": {"article_id": "L3141-1"}}
+        ])]}},
+        {"tools": {"messages": [
+            _FakeToolMessage("Observation déjà vue", "call_1"),
+            _FakeAIMessage(conclusion),
+        ]}},
+    ]
+
+    fake_status = Mock()
+    with patch("streamlit_app.st.status", return_value=fake_status):
+        chunks = list(process_streaming_events(iter(events)))
+
+    assert "".join(chunks) == conclusion
+    # Le statut d'outil n'est pas laissé en "running" par l'AIMessage final
+    fake_status.update.assert_called_with(label="✅ Terminé", state="complete")
+
+
+def test_tool_status_closed_on_nominal_turn():
+    """Cas nominal : update "tools" composé du seul ToolMessage."""
+    events = [
+        {"agent": {"messages": [_FakeAIMessage(tool_calls=[
+            {"name": "search_legifrance", "id": "call_1", "args": {"query": "congés payés"}}
+        ])]}},
+        {"tools": {"messages": [_FakeToolMessage("Résultats de recherche", "call_1")]}},
+        {"agent": {"messages": [_FakeAIMessage("Réponse finale.")]}},
+    ]
+
+    fake_status = Mock()
+    with patch("streamlit_app.st.status", return_value=fake_status):
+        chunks = list(process_streaming_events(iter(events)))
+
+    assert "".join(chunks) == "Réponse finale."
+    fake_status.update.assert_called_with(label="✅ Terminé", state="complete")
@@ -4,14 +4,12 @@ Tests pour les outils RegulAI.
 Ce module teste les fonctionnalités des outils MCP et leur intégration LangChain.
 """
 
+import httpx
 import pytest
-from unittest.mock import patch, Mock, MagicMock
-import os
-import sys
-
-# Ajouter le répertoire src au PYTHONPATH
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from unittest.mock import patch, Mock
 
+# Le répertoire src est ajouté au PYTHONPATH par tests/conftest.py,
+# exécuté par pytest avant l'import des modules de test
 from regulai.tools import get_available_tools, MCPClient, search_legifrance
 
 
@@ -19,11 +17,13 @@ def test_get_available_tools():
     """Test que les outils sont correctement chargés."""
     tools = get_available_tools()
     
-    assert len(tools) == 3
+    assert len(tools) == 5
     tool_names = [tool.name for tool in tools]
     assert "search_legifrance" in tool_names
     assert "get_article" in tool_names
     assert "browse_code" in tool_names
+    assert "batch_get_article" in tool_names
+    assert "batch_search_legifrance" in tool_names
 
 
 def test_mcp_client_initialization():
@@ -69,54 +69,157 @@ def test_search_legifrance_tool_call(mock_get_client):
     )
 
 
-def test_mcp_client_parse_response():
+@patch('regulai.tools.get_mcp_client')
+def test_batch_get_article_tool_call(mock_get_client):
+    """Test l'appel groupé de récupération d'articles."""
+    from regulai.tools import batch_get_article
+
+    mock_client = Mock()
+    mock_client.call_tool.side_effect = ["Contenu article 1", "Contenu article 2"]
+    mock_get_client.return_value = mock_client
+
+    result = batch_get_article.invoke({"article_ids": ["L3141-1", "L3141-2"]})
+
+    assert "=== Article L3141-1 ===" in result
+    assert "Contenu article 1" in result
+    assert "=== Article L3141-2 ===" in result
+    assert "Contenu article 2" in result
+    assert mock_client.call_tool.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        # Réponse normale (contenu MCP imbriqué)
+        ({"result": {"content": [{"text": "Contenu de test"}]}}, "Contenu de test"),
+        # Réponse simple (résultat chaîne directe)
+        ({"result": "Réponse simple"}, "Réponse simple"),
+    ],
+    ids=["contenu-imbrique", "reponse-simple"],
+)
+def test_mcp_client_parse_response(mcp_client, response, expected):
     """Test le parsing des réponses MCP."""
-    client = MCPClient()
-    
-    # Test réponse normale
-    response = {
-        "result": {
-            "content": [
-                {"text": "Contenu de test"}
-            ]
-        }
-    }
-    
-    result = client._parse_mcp_response(response)
-    assert result == "Contenu de test"
-    
-    # Test réponse simple
-    response_simple = {
-        "result": "Réponse simple"
-    }
-    
-    result_simple = client._parse_mcp_response(response_simple)
-    assert result_simple == "Réponse simple"
+    assert mcp_client._parse_mcp_response(response) == expected
 
 
-@patch('httpx.Client')
-def test_mcp_client_connection_test(mock_httpx_client):
-    """Test la vérification de connexion MCP."""
-    
-    # Mock de la réponse HTTP
+def test_mcp_client_response_cache():
+    """Test que les appels identiques sont servis depuis le cache."""
+    client = MCPClient("http://test:8000")
+
+    # Mock du client HTTP persistant
     mock_response = Mock()
     mock_response.status_code = 200
-    
-    # Créer un mock pour la session HTTP qui fonctionne comme context manager
-    mock_session = Mock()
-    mock_session.get.return_value = mock_response
-    
-    # Utiliser MagicMock pour supporter automatiquement les context managers
-    mock_context_manager = MagicMock()
-    mock_context_manager.__enter__.return_value = mock_session
-    mock_context_manager.__exit__.return_value = None
-    
-    # Le Client() retourne le context manager
-    mock_httpx_client.return_value = mock_context_manager
-    
+    mock_response.json.return_value = {"result": "Réponse cachable"}
+
+    mock_http = Mock()
+    mock_http.post.return_value = mock_response
+
+    with patch.object(client, '_get_client', return_value=mock_http):
+        # Premier appel : requête HTTP effectuée
+        result1 = client.call_tool("search_legifrance", {"query": "congés payés"})
+        # Deuxième appel identique : servi depuis le cache
+        result2 = client.call_tool("search_legifrance", {"query": "congés payés"})
+
+    assert result1 == "Réponse cachable"
+    assert result2 == "Réponse cachable"
+    assert mock_http.post.call_count == 1
+
+    # Après vidage du cache, la requête est refaite
+    client.clear_cache()
+    with patch.object(client, '_get_client', return_value=mock_http):
+        client.call_tool("search_legifrance", {"query": "congés payés"})
+    assert mock_http.post.call_count == 2
+
+
+def test_mcp_client_retries_on_server_error():
+    """Test qu'une erreur 5xx transitoire est relancée puis aboutit."""
+    client = MCPClient("http://test:8000")
+
+    error_response = Mock()
+    error_response.status_code = 500
+    error_response.content = b'{"detail": "indisponible"}'
+
+    ok_response = Mock()
+    ok_response.status_code = 200
+    ok_response.json.return_value = {"result": "Réponse après relance"}
+
+    mock_http = Mock()
+    mock_http.post.side_effect = [error_response, ok_response]
+
+    with patch.object(client, '_get_client', return_value=mock_http), \
+         patch.object(MCPClient, '_retry_delay', return_value=0.0):
+        result = client.call_tool("search_legifrance", {"query": "relance"})
+
+    assert result == "Réponse après relance"
+    assert mock_http.post.call_count == 2
+
+
+def test_mcp_client_circuit_breaker_short_circuits():
+    """Test que le disjoncteur court-circuite après des échecs répétés."""
+    client = MCPClient("http://test:8000")
+
+    mock_http = Mock()
+    mock_http.post.side_effect = httpx.RequestError("connexion refusée")
+
+    with patch.object(client, '_get_client', return_value=mock_http), \
+         patch.object(MCPClient, '_retry_delay', return_value=0.0):
+        # Provoquer assez d'échecs consécutifs pour ouvrir le disjoncteur
+        for i in range(MCPClient._BREAKER_THRESHOLD):
+            client.call_tool("get_article", {"article_id": f"L{i}"})
+        calls_before = mock_http.post.call_count
+
+        # Disjoncteur ouvert : l'appel suivant n'atteint pas le serveur
+        result = client.call_tool("get_article", {"article_id": "L9999"})
+
+    assert "temporairement indisponible" in result
+    assert mock_http.post.call_count == calls_before
+
+
+class _FakeResponse:
+    """Réponse HTTP minimale pour les tests de sonde."""
+
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class _FakeHTTPClient:
+    """
+    Client HTTP minimal qui enregistre les GET reçus.
+
+    Plus léger qu'un Mock : pas de protocole d'attributs dynamiques ni de
+    suivi de chaque accès, juste la liste des URLs sondées.
+    """
+
+    def __init__(self, status_code: int = 200):
+        self.requested_urls = []
+        self._status_code = status_code
+
+    def get(self, url):
+        self.requested_urls.append(url)
+        return _FakeResponse(self._status_code)
+
+
+def test_mcp_client_connection_test():
+    """Test la vérification de connexion MCP."""
+    fake_http = _FakeHTTPClient()
+
     # Test de connexion
     client = MCPClient("http://test:8000")
-    result = client.test_connection()
-    
+    with patch.object(client, '_get_client', return_value=fake_http):
+        result = client.test_connection()
+
     assert result is True
-    mock_session.get.assert_called_once_with("http://test:8000/health") 
\ No newline at end of file
+    assert fake_http.requested_urls == ["http://test:8000/health"]
+
+
+def test_mcp_client_connection_probe_cached():
+    """Test que la sonde de connexion est servie depuis le cache dans le TTL."""
+    fake_http = _FakeHTTPClient()
+
+    client = MCPClient("http://test:8000")
+    with patch.object(client, '_get_client', return_value=fake_http):
+        assert client.test_connection() is True
+        # Deuxième sonde dans la fenêtre de fraîcheur : aucun nouvel appel HTTP
+        assert client.test_connection() is True
+
+    assert len(fake_http.requested_urls) == 1
\ No newline at end of file